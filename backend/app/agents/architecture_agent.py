@@ -10,6 +10,39 @@ from pathlib import Path
 from collections import defaultdict, deque
 from .base_agent import BaseAgent
 
+# JavaScript/TypeScript module specifiers in import, require() and import()
+JS_IMPORT_PATTERNS = [re.compile(p) for p in [
+    r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
+    r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
+    r'import\s*\(\s*["\']([^"\']+)["\']\s*\)'
+]]
+
+# Source hints of the Singleton, Factory and Observer design patterns
+SINGLETON_INDICATORS = [re.compile(p, re.IGNORECASE) for p in [
+    r'class.*Singleton',
+    r'_instance\s*=\s*None',
+    r'def\s+__new__.*if.*not.*instance',
+    r'getInstance\(\)',
+    r'private\s+static.*instance'
+]]
+
+FACTORY_INDICATORS = [re.compile(p, re.IGNORECASE) for p in [
+    r'class.*Factory',
+    r'def\s+create.*\(',
+    r'def\s+make.*\(',
+    r'Factory\s*\(',
+    r'createInstance'
+]]
+
+OBSERVER_INDICATORS = [re.compile(p, re.IGNORECASE) for p in [
+    r'class.*Observer',
+    r'def\s+notify.*\(',
+    r'def\s+update.*\(',
+    r'addEventListener',
+    r'subscribe.*\(',
+    r'emit.*\('
+]]
+
 class ArchitectureAgent(BaseAgent):
     """Agent for analyzing software architecture and design patterns"""
     
@@ -107,19 +140,22 @@ class ArchitectureAgent(BaseAgent):
             'organization_score': 0
         }
         
-        # Get directory tree
+        # Get directory tree; relative path and depth are derived once per
+        # directory by slicing off the repository prefix
+        prefix_len = len(os.path.join(repo_path, ''))
         for root, dirs, files in os.walk(repo_path):
-            level = root.replace(repo_path, '').count(os.sep)
+            rel_path = root[prefix_len:]
+            level = rel_path.count(os.sep) + 1 if rel_path else 0
             structure['depth'] = max(structure['depth'], level)
             
-            if level <= 3:  # Only track top-level structure
-                rel_path = os.path.relpath(root, repo_path)
-                if rel_path != '.':
-                    structure['directories'].append(rel_path)
+            if rel_path and level <= 3:  # Only track top-level structure
+                structure['directories'].append(rel_path)
         
-        # Check for common architectural patterns
+        # Check for common architectural patterns with one substring search
+        # per pattern over all directory names
+        directory_names = '\n'.join(structure['directories']).lower()
         common_dirs = ['src', 'lib', 'app', 'components', 'services', 'models', 'controllers', 'views', 'utils', 'config']
-        found_patterns = [d for d in common_dirs if any(d in dir_name.lower() for dir_name in structure['directories'])]
+        found_patterns = [d for d in common_dirs if d in directory_names]
         structure['common_patterns'] = found_patterns
         
         # Score organization (0-100)
@@ -290,7 +326,7 @@ class ArchitectureAgent(BaseAgent):
     def _extract_python_dependencies(self, content: str, module_name: str):
         """Extract Python import dependencies"""
         try:
-            tree = ast.parse(content)
+            tree = self.parse_python(content)
             
             for node in ast.walk(tree):
                 if isinstance(node, ast.Import):
@@ -305,14 +341,8 @@ class ArchitectureAgent(BaseAgent):
     
     def _extract_javascript_dependencies(self, content: str, module_name: str):
         """Extract JavaScript/TypeScript import dependencies"""
-        import_patterns = [
-            r'import\s+.*\s+from\s+["\']([^"\']+)["\']',
-            r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
-            r'import\s*\(\s*["\']([^"\']+)["\']\s*\)'
-        ]
-        
-        for pattern in import_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in JS_IMPORT_PATTERNS:
+            matches = pattern.findall(content)
             for match in matches:
                 self.dependency_graph[module_name].add(match)
     
@@ -400,40 +430,15 @@ class ArchitectureAgent(BaseAgent):
     
     def _detect_singleton_pattern(self, content: str) -> bool:
         """Detect Singleton pattern in code"""
-        singleton_indicators = [
-            r'class.*Singleton',
-            r'_instance\s*=\s*None',
-            r'def\s+__new__.*if.*not.*instance',
-            r'getInstance\(\)',
-            r'private\s+static.*instance'
-        ]
-        
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in singleton_indicators)
+        return any(pattern.search(content) for pattern in SINGLETON_INDICATORS)
     
     def _detect_factory_pattern(self, content: str) -> bool:
         """Detect Factory pattern in code"""
-        factory_indicators = [
-            r'class.*Factory',
-            r'def\s+create.*\(',
-            r'def\s+make.*\(',
-            r'Factory\s*\(',
-            r'createInstance'
-        ]
-        
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in factory_indicators)
+        return any(pattern.search(content) for pattern in FACTORY_INDICATORS)
     
     def _detect_observer_pattern(self, content: str) -> bool:
         """Detect Observer pattern in code"""
-        observer_indicators = [
-            r'class.*Observer',
-            r'def\s+notify.*\(',
-            r'def\s+update.*\(',
-            r'addEventListener',
-            r'subscribe.*\(',
-            r'emit.*\('
-        ]
-        
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in observer_indicators)
+        return any(pattern.search(content) for pattern in OBSERVER_INDICATORS)
     
     async def _analyze_with_llm(self, sample_files: List[str], repo_path: str) -> Dict[str, Any]:
         """Use LLM for high-level architecture analysis"""
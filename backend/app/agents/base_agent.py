@@ -2,15 +2,84 @@
 Base Agent class for the LLM Static Analysis Platform
 """
 import os
+import ast
 import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Parsed Python modules shared by all agents of one analysis run, keyed by
+# content digest, so a file analysed by several agents is only parsed once.
+# Each run gets its own cache (see ast_cache_scope), dropped when it ends
+AST_CACHE_MAX_ENTRIES = 512
+_ast_cache: "ContextVar[Optional[OrderedDict]]" = ContextVar('ast_cache', default=None)
+
+DEFAULT_EXCLUDE_DIRS = frozenset([
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv',
+    'dist', 'build', '.next', 'coverage', '.pytest_cache'
+])
+
+# Directories skipped by repository statistics, besides hidden ones
+STATS_EXCLUDE_DIRS = frozenset(['__pycache__', 'node_modules'])
+
+# Read size used when counting lines for repository statistics
+LINE_COUNT_CHUNK_SIZE = 1024 * 1024
+
+# Extensions whose lines are counted in repository statistics
+LINE_COUNT_EXTENSIONS = frozenset([
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h', '.cs', '.php', '.rb', '.go'
+])
+
+TEXT_EXTENSIONS = frozenset([
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h', 
+    '.cs', '.php', '.rb', '.go', '.rs', '.kt', '.swift', '.scala',
+    '.html', '.css', '.scss', '.sass', '.less', '.xml', '.json',
+    '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.txt',
+    '.md', '.rst', '.sql', '.sh', '.bash', '.zsh', '.fish',
+    '.dockerfile', '.gitignore', '.env'
+])
+
+TEXT_FILE_NAMES = frozenset([
+    'dockerfile', 'makefile', 'readme', 'license', 'changelog', 'requirements.txt'
+])
+
+def count_lines(f: BinaryIO) -> int:
+    """Count lines in a binary file the way text-mode iteration does"""
+    breaks = 0
+    last = b''
+    while True:
+        chunk = f.read(LINE_COUNT_CHUNK_SIZE)
+        if not chunk:
+            break
+        # Universal newlines: \n, \r\n and a lone \r each end a line
+        breaks += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+        # A \r\n pair split across two chunks was counted twice
+        if last == b'\r' and chunk[:1] == b'\n':
+            breaks -= 1
+        last = chunk[-1:]
+    
+    if not last:
+        return 0
+    return breaks if last in (b'\n', b'\r') else breaks + 1
+
+@contextmanager
+def ast_cache_scope():
+    """Share parsed Python trees between the agents run inside the block"""
+    token = _ast_cache.set(OrderedDict())
+    try:
+        yield
+    finally:
+        _ast_cache.reset(token)
+
 class BaseAgent(ABC):
     """Abstract base class for all analysis agents"""
     
@@ -28,28 +97,44 @@ class BaseAgent(ABC):
     def get_file_content(self, file_path: str, max_size: int = 50000) -> Optional[str]:
         """Safely read file content with size limit"""
         try:
-            if not os.path.exists(file_path):
-                return None
-            
-            # Check file size
-            if os.path.getsize(file_path) > max_size:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            # Size comes from the open descriptor: one open and one fstat per file
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                if os.fstat(f.fileno()).st_size > max_size:
                     content = f.read(max_size)
                     return content + "\n... [FILE TRUNCATED DUE TO SIZE]"
-            
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 return f.read()
-                
+        
+        except FileNotFoundError:
+            return None
         except Exception as e:
             self.logger.error(f"Error reading file {file_path}: {e}")
             return None
     
+    def parse_python(self, content: str) -> ast.Module:
+        """Parse Python source, reusing the tree if the same content was already parsed in this run"""
+        cache = _ast_cache.get()
+        if cache is None:
+            return ast.parse(content)
+        
+        key = hashlib.blake2b(content.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+        tree = cache.get(key)
+        if tree is not None:
+            cache.move_to_end(key)
+            return tree
+        
+        tree = ast.parse(content)
+        cache[key] = tree
+        if len(cache) > AST_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return tree
+    
     def find_files_by_extension(self, repo_path: str, extensions: List[str], 
                                exclude_dirs: Optional[List[str]] = None) -> List[str]:
         """Find files with specific extensions, excluding certain directories"""
-        if exclude_dirs is None:
-            exclude_dirs = ['.git', '__pycache__', 'node_modules', '.venv', 'venv', 
-                           'dist', 'build', '.next', 'coverage', '.pytest_cache']
+        exclude_dirs = DEFAULT_EXCLUDE_DIRS if exclude_dirs is None else frozenset(exclude_dirs)
+        
+        # str.endswith with a tuple checks every suffix in one call
+        suffixes = tuple(extensions)
         
         files = []
         for root, dirs, filenames in os.walk(repo_path):
@@ -57,7 +142,7 @@ class BaseAgent(ABC):
             dirs[:] = [d for d in dirs if d not in exclude_dirs]
             
             for filename in filenames:
-                if any(filename.endswith(ext) for ext in extensions):
+                if filename.endswith(suffixes):
                     files.append(os.path.join(root, filename))
         
         return files
@@ -72,35 +157,50 @@ class BaseAgent(ABC):
         }
         
         try:
-            for root, dirs, files in os.walk(repo_path):
-                # Skip hidden and cache directories
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
+            # Explicit scandir stack: DirEntry carries the file type from the
+            # directory listing, so only regular files need a stat call
+            pending = [repo_path]
+            while pending:
+                try:
+                    entries = os.scandir(pending.pop())
+                except OSError:
+                    # Unreadable directory, skipped like os.walk does
+                    continue
                 
-                for file in files:
-                    if file.startswith('.'):
-                        continue
+                with entries:
+                    for entry in entries:
+                        name = entry.name
+                        # Skip hidden files and directories
+                        if name.startswith('.'):
+                            continue
                         
-                    file_path = os.path.join(root, file)
-                    try:
-                        stats['total_files'] += 1
-                        stats['size_bytes'] += os.path.getsize(file_path)
-                        
-                        # File extension
-                        ext = Path(file).suffix.lower()
-                        if ext:
-                            stats['file_types'][ext] = stats['file_types'].get(ext, 0) + 1
-                        
-                        # Count lines for text files
-                        if ext in ['.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h', '.cs', '.php', '.rb', '.go']:
-                            try:
-                                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                    stats['total_lines'] += sum(1 for _ in f)
-                            except:
-                                pass
-                                
-                    except OSError:
-                        continue
+                        try:
+                            if entry.is_dir():
+                                # Skip cache directories; like os.walk, don't follow links
+                                if name not in STATS_EXCLUDE_DIRS and not entry.is_symlink():
+                                    pending.append(entry.path)
+                                continue
+                            
+                            stats['total_files'] += 1
+                            stats['size_bytes'] += entry.stat().st_size
+                            
+                            # File extension (same rules as Path.suffix)
+                            dot = name.rfind('.')
+                            ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ''
+                            if ext:
+                                stats['file_types'][ext] = stats['file_types'].get(ext, 0) + 1
+                            
+                            # Count lines for text files
+                            if ext in LINE_COUNT_EXTENSIONS:
+                                try:
+                                    with open(entry.path, 'rb') as f:
+                                        stats['total_lines'] += count_lines(f)
+                                except:
+                                    pass
                         
+                        except OSError:
+                            continue
+        
         except Exception as e:
             self.logger.error(f"Error getting repo stats: {e}")
         
@@ -109,12 +209,22 @@ class BaseAgent(ABC):
     def create_result_structure(self, score: int, issues: List[Dict] = None, 
                               summary: str = "", suggestions: List[str] = None) -> Dict[str, Any]:
         """Create standardized result structure"""
+        issues = issues or []
+        # Issue descriptions (often free-form LLM or tool text) are capped once
+        # here, so stored results and summary prompts stay small
+        max_length = settings.ISSUE_DESC_MAX_LENGTH
+        if max_length > 0:
+            for issue in issues:
+                desc = issue.get('desc')
+                if isinstance(desc, str) and len(desc) > max_length:
+                    issue['desc'] = desc[:max(max_length - 3, 0)] + '...'
+        
         return {
             'agent': self.name,
             'category': self.category,
             'score': min(100, max(0, score)),  # Ensure score is 0-100
             'summary': summary,
-            'issues': issues or [],
+            'issues': issues,
             'suggestions': suggestions or [],
             'timestamp': datetime.utcnow().isoformat(),
             'version': '1.0'
@@ -134,15 +244,5 @@ class BaseAgent(ABC):
     
     def is_text_file(self, file_path: str) -> bool:
         """Check if file is a text file that can be analyzed"""
-        text_extensions = {
-            '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.h', 
-            '.cs', '.php', '.rb', '.go', '.rs', '.kt', '.swift', '.scala',
-            '.html', '.css', '.scss', '.sass', '.less', '.xml', '.json',
-            '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.txt',
-            '.md', '.rst', '.sql', '.sh', '.bash', '.zsh', '.fish',
-            '.dockerfile', '.gitignore', '.env'
-        }
-        
-        return Path(file_path).suffix.lower() in text_extensions or Path(file_path).name.lower() in [
-            'dockerfile', 'makefile', 'readme', 'license', 'changelog', 'requirements.txt'
-        ]
+        path = Path(file_path)
+        return path.suffix.lower() in TEXT_EXTENSIONS or path.name.lower() in TEXT_FILE_NAMES
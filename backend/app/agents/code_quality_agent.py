@@ -4,10 +4,17 @@ Code Quality Agent - Analyzes code readability, maintainability, naming consiste
 import os
 import ast
 import re
+import hashlib
+import heapq
+from collections import Counter
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from .base_agent import BaseAgent
 
+# JavaScript function starts, and TODO/FIXME-style comment markers
+JS_FUNCTION_START_PATTERN = re.compile(r'function\s+\w+|const\s+\w+\s*=\s*\(|\w+\s*:\s*\(')
+TODO_COMMENT_PATTERN = re.compile(r'(TODO|FIXME|HACK|XXX)', re.IGNORECASE)
+
 class CodeQualityAgent(BaseAgent):
     """Agent for analyzing code quality, complexity, and maintainability"""
     
@@ -60,6 +67,10 @@ class CodeQualityAgent(BaseAgent):
         """Perform static analysis for code quality issues"""
         issues = []
         
+        # Copies of the same file (vendored modules, generated stubs) produce
+        # the same findings, so each distinct content is only analyzed once
+        issues_by_content = {}
+        
         for file_path in code_files:
             try:
                 content = self.get_file_content(file_path)
@@ -68,14 +79,35 @@ class CodeQualityAgent(BaseAgent):
                 
                 relative_path = os.path.relpath(file_path, repo_path)
                 
-                # Analyze based on file type
                 if file_path.endswith('.py'):
-                    issues.extend(self._analyze_python_file(content, relative_path))
+                    file_type = 'python'
                 elif file_path.endswith(('.js', '.ts', '.jsx', '.tsx')):
-                    issues.extend(self._analyze_javascript_file(content, relative_path))
+                    file_type = 'javascript'
+                else:
+                    file_type = 'other'
+                
+                content_digest = hashlib.blake2b(
+                    content.encode('utf-8', errors='surrogatepass'), digest_size=16
+                ).digest()
+                content_key = (content_digest, file_type)
+                known_issues = issues_by_content.get(content_key)
+                if known_issues is not None:
+                    issues.extend({**issue, "file": relative_path} for issue in known_issues)
+                    continue
+                
+                file_issues = []
+                
+                # Analyze based on file type
+                if file_type == 'python':
+                    file_issues.extend(self._analyze_python_file(content, relative_path))
+                elif file_type == 'javascript':
+                    file_issues.extend(self._analyze_javascript_file(content, relative_path))
                 
                 # General quality checks
-                issues.extend(self._analyze_general_quality(content, relative_path))
+                file_issues.extend(self._analyze_general_quality(content, relative_path))
+                
+                issues_by_content[content_key] = file_issues
+                issues.extend(file_issues)
                 
             except Exception as e:
                 self.logger.error(f"Error analyzing file {file_path}: {e}")
@@ -92,7 +124,7 @@ class CodeQualityAgent(BaseAgent):
         issues = []
         
         try:
-            tree = ast.parse(content)
+            tree = self.parse_python(content)
             
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
@@ -149,7 +181,7 @@ class CodeQualityAgent(BaseAgent):
         
         for i, line in enumerate(lines, 1):
             # Simple function detection
-            if re.search(r'function\s+\w+|const\s+\w+\s*=\s*\(|\w+\s*:\s*\(', line):
+            if JS_FUNCTION_START_PATTERN.search(line):
                 in_function = True
                 function_start = i
                 brace_count = 0
@@ -195,7 +227,7 @@ class CodeQualityAgent(BaseAgent):
                 })
             
             # Check for TODO/FIXME comments
-            if re.search(r'(TODO|FIXME|HACK|XXX)', line, re.IGNORECASE):
+            if TODO_COMMENT_PATTERN.search(line):
                 issues.append({
                     "file": file_path,
                     "line": i,
@@ -234,9 +266,9 @@ class CodeQualityAgent(BaseAgent):
             except OSError:
                 continue
         
-        # Sort by size and take top files
-        files_with_size.sort(key=lambda x: x[1], reverse=True)
-        return [f[0] for f in files_with_size[:max_files]]
+        # Take the largest files without sorting the whole list
+        largest = heapq.nlargest(max_files, files_with_size, key=lambda x: x[1])
+        return [f[0] for f in largest]
     
     async def _analyze_with_llm(self, sample_files: List[str], repo_path: str) -> List[Dict]:
         """Use LLM to analyze code quality"""
@@ -286,10 +318,7 @@ class CodeQualityAgent(BaseAgent):
         suggestions = []
         
         # Categorize issues
-        categories = {}
-        for issue in issues:
-            severity = issue.get("severity", "low")
-            categories[severity] = categories.get(severity, 0) + 1
+        categories = Counter(issue.get("severity", "low") for issue in issues)
         
         if categories.get("high", 0) > 0 or categories.get("critical", 0) > 0:
             suggestions.append("Address high-severity issues first to improve code stability")
@@ -310,10 +339,7 @@ class CodeQualityAgent(BaseAgent):
     
     def _generate_summary(self, score: int, issues: List[Dict], total_files: int) -> str:
         """Generate analysis summary"""
-        severity_counts = {}
-        for issue in issues:
-            severity = issue.get("severity", "low")
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        severity_counts = Counter(issue.get("severity", "low") for issue in issues)
         
         summary = f"Analyzed {total_files} files with overall quality score of {score}/100. "
         
@@ -3,12 +3,27 @@ Dependency & License Agent - Reviews third-party dependencies and licensing issu
 """
 import os
 import json
+import orjson
+import asyncio
 import re
 import subprocess
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from .base_agent import BaseAgent
 
+# Packages with known licensing/security issues (example list)
+PROBLEMATIC_PACKAGES = {
+    'python': frozenset(['gpgme', 'pycrypto']),
+    'javascript': frozenset(['natives', 'event-stream']),
+}
+
+# requirements.txt 'name<op>version' lines and Maven <dependency> blocks
+REQUIREMENT_LINE_PATTERN = re.compile(r'^([a-zA-Z0-9_\-\.]+)([>=<~!]+)(.+)$')
+MAVEN_DEPENDENCY_PATTERN = re.compile(
+    r'<dependency>.*?<groupId>(.*?)</groupId>.*?<artifactId>(.*?)</artifactId>.*?<version>(.*?)</version>.*?</dependency>',
+    re.DOTALL
+)
+
 class DependencyAgent(BaseAgent):
     """Agent for analyzing dependencies, licenses, and package management"""
     
@@ -39,14 +54,21 @@ class DependencyAgent(BaseAgent):
                 summary="No dependency files found - no dependencies to analyze"
             )
         
-        # Analyze different aspects
-        dependency_analysis = await self._analyze_dependencies(dependency_files, repo_path)
-        security_analysis = await self._analyze_security_vulnerabilities(dependency_files, repo_path)
-        license_analysis = await self._analyze_licenses(dependency_files, repo_path)
-        management_analysis = await self._analyze_dependency_management(dependency_files, repo_path)
-        
-        # LLM analysis for dependency best practices
-        llm_analysis = await self._analyze_with_llm(dependency_files[:2], repo_path)
+        # Parse each dependency file once; both the version and the license
+        # checks work from the same parsed result
+        parsed_dependencies = self._parse_dependency_files(dependency_files)
+        
+        # Analyze different aspects concurrently; the LLM analysis of
+        # dependency best practices is started first so its requests are in
+        # flight while the local checks run
+        (llm_analysis, dependency_analysis, security_analysis,
+         license_analysis, management_analysis) = await asyncio.gather(
+            self._analyze_with_llm(dependency_files[:2], repo_path),
+            self._analyze_dependencies(dependency_files, repo_path, parsed_dependencies),
+            self._analyze_security_vulnerabilities(dependency_files, repo_path),
+            self._analyze_licenses(dependency_files, repo_path, parsed_dependencies),
+            self._analyze_dependency_management(dependency_files, repo_path)
+        )
         
         # Combine all issues
         all_issues = (dependency_analysis.get('issues', []) + 
@@ -90,7 +112,15 @@ class DependencyAgent(BaseAgent):
         
         return found_files
     
-    async def _analyze_dependencies(self, dependency_files: List[Tuple[str, str]], repo_path: str) -> Dict[str, Any]:
+    def _parse_dependency_files(self, dependency_files: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Parse every dependency file once, keyed by file path"""
+        return {
+            file_path: self._parse_dependency_file(file_path, ecosystem)
+            for file_path, ecosystem in dependency_files
+        }
+    
+    async def _analyze_dependencies(self, dependency_files: List[Tuple[str, str]], repo_path: str,
+                                    parsed_dependencies: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze dependency management and versions"""
         issues = []
         dependencies = {}
@@ -98,7 +128,7 @@ class DependencyAgent(BaseAgent):
         for file_path, ecosystem in dependency_files:
             try:
                 relative_path = os.path.relpath(file_path, repo_path)
-                file_deps = self._parse_dependency_file(file_path, ecosystem)
+                file_deps = parsed_dependencies[file_path]
                 
                 if file_deps:
                     dependencies[relative_path] = file_deps
@@ -151,7 +181,7 @@ class DependencyAgent(BaseAgent):
                     line = line.strip()
                     if line and not line.startswith('#'):
                         # Parse package==version or package>=version
-                        match = re.match(r'^([a-zA-Z0-9_\-\.]+)([>=<~!]+)(.+)$', line)
+                        match = REQUIREMENT_LINE_PATTERN.match(line)
                         if match:
                             package, operator, version = match.groups()
                             dependencies[package] = {
@@ -200,7 +230,7 @@ class DependencyAgent(BaseAgent):
             content = self.get_file_content(file_path)
             if content:
                 try:
-                    data = json.loads(content)
+                    data = orjson.loads(content)
                     
                     # Parse dependencies and devDependencies
                     for dep_type in ['dependencies', 'devDependencies', 'peerDependencies']:
@@ -224,8 +254,7 @@ class DependencyAgent(BaseAgent):
             content = self.get_file_content(file_path)
             if content:
                 # Simple regex-based parsing for Maven dependencies
-                dependency_pattern = r'<dependency>.*?<groupId>(.*?)</groupId>.*?<artifactId>(.*?)</artifactId>.*?<version>(.*?)</version>.*?</dependency>'
-                matches = re.findall(dependency_pattern, content, re.DOTALL)
+                matches = MAVEN_DEPENDENCY_PATTERN.findall(content)
                 
                 for group_id, artifact_id, version in matches:
                     package_name = f"{group_id.strip()}:{artifact_id.strip()}"
@@ -280,39 +309,49 @@ class DependencyAgent(BaseAgent):
         """Analyze dependencies for security vulnerabilities"""
         issues = []
         
-        # Try to run security audit tools if available
-        for file_path, ecosystem in dependency_files:
-            relative_path = os.path.relpath(file_path, repo_path)
-            
-            try:
-                if ecosystem == 'python':
-                    # Try pip-audit or safety if available
-                    audit_issues = await self._run_python_security_audit(file_path, relative_path)
-                    issues.extend(audit_issues)
-                elif ecosystem == 'javascript':
-                    # Try npm audit
-                    audit_issues = await self._run_npm_security_audit(file_path, relative_path)
-                    issues.extend(audit_issues)
-            
-            except Exception as e:
-                self.logger.error(f"Error running security audit for {file_path}: {e}")
+        # Try to run security audit tools if available; each audit is a
+        # separate process, so all files are audited concurrently
+        file_issues = await asyncio.gather(*(
+            self._audit_dependency_file(file_path, ecosystem, repo_path)
+            for file_path, ecosystem in dependency_files
+        ))
+        for audit_issues in file_issues:
+            issues.extend(audit_issues)
         
         return {"issues": issues}
     
+    async def _audit_dependency_file(self, file_path: str, ecosystem: str, repo_path: str) -> List[Dict]:
+        """Run the security audit tool for one dependency file"""
+        relative_path = os.path.relpath(file_path, repo_path)
+        
+        try:
+            if ecosystem == 'python':
+                # Try pip-audit or safety if available
+                return await self._run_python_security_audit(file_path, relative_path)
+            elif ecosystem == 'javascript':
+                # Try npm audit
+                return await self._run_npm_security_audit(file_path, relative_path)
+        
+        except Exception as e:
+            self.logger.error(f"Error running security audit for {file_path}: {e}")
+        
+        return []
+    
     async def _run_python_security_audit(self, file_path: str, relative_path: str) -> List[Dict]:
         """Run Python security audit using pip-audit or safety"""
         issues = []
         
         try:
-            # Try pip-audit first
-            result = subprocess.run(
+            # Try pip-audit first; run in a worker thread so the event loop stays free
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ['pip-audit', '--format', 'json', '--requirement', file_path],
                 capture_output=True, text=True, timeout=30
             )
             
             if result.returncode == 0:
                 try:
-                    audit_data = json.loads(result.stdout)
+                    audit_data = orjson.loads(result.stdout)
                     for vulnerability in audit_data.get('vulnerabilities', []):
                         issues.append({
                             "file": relative_path,
@@ -338,7 +377,8 @@ class DependencyAgent(BaseAgent):
             # Change to directory containing package.json
             package_dir = os.path.dirname(file_path)
             
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ['npm', 'audit', '--json'],
                 cwd=package_dir,
                 capture_output=True, text=True, timeout=30
@@ -346,7 +386,7 @@ class DependencyAgent(BaseAgent):
             
             if result.stdout:
                 try:
-                    audit_data = json.loads(result.stdout)
+                    audit_data = orjson.loads(result.stdout)
                     
                     # Parse npm audit output
                     vulnerabilities = audit_data.get('vulnerabilities', {})
@@ -368,7 +408,8 @@ class DependencyAgent(BaseAgent):
         
         return issues
     
-    async def _analyze_licenses(self, dependency_files: List[Tuple[str, str]], repo_path: str) -> Dict[str, Any]:
+    async def _analyze_licenses(self, dependency_files: List[Tuple[str, str]], repo_path: str,
+                                parsed_dependencies: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze dependency licenses"""
         issues = []
         license_info = {}
@@ -378,16 +419,12 @@ class DependencyAgent(BaseAgent):
         
         for file_path, ecosystem in dependency_files:
             relative_path = os.path.relpath(file_path, repo_path)
-            dependencies = self._parse_dependency_file(file_path, ecosystem)
-            
-            # Check for known problematic packages (example list)
-            problematic_packages = {
-                'python': ['gpgme', 'pycrypto'],
-                'javascript': ['natives', 'event-stream'],
-            }
+            dependencies = parsed_dependencies[file_path]
             
+            # Check for known problematic packages
+            ecosystem_problematic = PROBLEMATIC_PACKAGES.get(ecosystem, frozenset())
             for package in dependencies.keys():
-                if package in problematic_packages.get(ecosystem, []):
+                if package in ecosystem_problematic:
                     issues.append({
                         "file": relative_path,
                         "desc": f"Package '{package}' has known licensing/security issues",
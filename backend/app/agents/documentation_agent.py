@@ -4,10 +4,24 @@ Documentation & Comment Agent - Ensures the codebase is well-documented and easy
 import os
 import ast
 import re
+import heapq
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 from .base_agent import BaseAgent
 
+# JavaScript function definitions, and class/interface declarations
+JS_FUNCTION_PATTERNS = [re.compile(p) for p in [
+    r'function\s+(\w+)\s*\(',
+    r'const\s+(\w+)\s*=\s*\(',
+    r'(\w+)\s*:\s*function\s*\(',
+    r'(\w+)\s*\([^)]*\)\s*{',  # Arrow functions
+]]
+
+JS_CLASS_PATTERNS = [re.compile(p) for p in [
+    r'class\s+(\w+)',
+    r'interface\s+(\w+)',
+]]
+
 class DocumentationAgent(BaseAgent):
     """Agent for analyzing documentation quality and completeness"""
     
@@ -137,7 +151,7 @@ class DocumentationAgent(BaseAgent):
             return issues, stats
         
         try:
-            tree = ast.parse(content)
+            tree = self.parse_python(content)
             
             # Check module docstring
             stats['total_modules'] = 1
@@ -247,22 +261,10 @@ class DocumentationAgent(BaseAgent):
             })
         
         # Simple pattern matching for functions and classes
-        function_patterns = [
-            r'function\s+(\w+)\s*\(',
-            r'const\s+(\w+)\s*=\s*\(',
-            r'(\w+)\s*:\s*function\s*\(',
-            r'(\w+)\s*\([^)]*\)\s*{',  # Arrow functions
-        ]
-        
-        class_patterns = [
-            r'class\s+(\w+)',
-            r'interface\s+(\w+)',
-        ]
-        
         for i, line in enumerate(lines, 1):
             # Check for function definitions
-            for pattern in function_patterns:
-                match = re.search(pattern, line)
+            for pattern in JS_FUNCTION_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     func_name = match.group(1)
                     stats['total_functions'] += 1
@@ -285,8 +287,8 @@ class DocumentationAgent(BaseAgent):
                         })
             
             # Check for class definitions
-            for pattern in class_patterns:
-                match = re.search(pattern, line)
+            for pattern in JS_CLASS_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     class_name = match.group(1)
                     stats['total_classes'] += 1
@@ -543,9 +545,9 @@ class DocumentationAgent(BaseAgent):
             except OSError:
                 scored_files.append((file_path, 0))
         
-        # Sort by score and take top files
-        scored_files.sort(key=lambda x: x[1], reverse=True)
-        return [f[0] for f in scored_files[:max_files]]
+        # Take the top scored files without sorting the whole list
+        top_files = heapq.nlargest(max_files, scored_files, key=lambda x: x[1])
+        return [f[0] for f in top_files]
     
     async def _analyze_with_llm(self, sample_files: List[str], repo_path: str) -> Dict[str, Any]:
         """Use LLM for documentation quality analysis"""
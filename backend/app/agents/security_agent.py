@@ -4,10 +4,116 @@ Security Agent - Evaluates the repository for potential security vulnerabilities
 import os
 import re
 import json
-from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Pattern
 from pathlib import Path
 from .base_agent import BaseAgent
 
+# Hardcoded credential patterns by secret type, and vulnerability patterns by
+# vulnerability type with their severity and CWE
+_SECRET_PATTERN_SOURCES = {
+    'api_key': r'(?i)(api[_-]?key|apikey)\s*[=:]\s*["\']?([a-zA-Z0-9_\-]{20,})["\']?',
+    'secret_key': r'(?i)(secret[_-]?key|secretkey)\s*[=:]\s*["\']?([a-zA-Z0-9_\-]{20,})["\']?',
+    'password': r'(?i)(password|passwd|pwd)\s*[=:]\s*["\']?([^"\'\s]{8,})["\']?',
+    'token': r'(?i)(token|auth[_-]?token)\s*[=:]\s*["\']?([a-zA-Z0-9_\-\.]{20,})["\']?',
+    'private_key': r'-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----',
+    'aws_access_key': r'AKIA[0-9A-Z]{16}',
+    'aws_secret_key': r'(?i)aws[_-]?secret[_-]?access[_-]?key.*[=:]\s*["\']?([a-zA-Z0-9/+=]{40})["\']?',
+    'github_token': r'ghp_[a-zA-Z0-9]{36}',
+    'jwt_token': r'eyJ[a-zA-Z0-9_\-]*\.eyJ[a-zA-Z0-9_\-]*\.[a-zA-Z0-9_\-]*',
+    'database_url': r'(?i)(database[_-]?url|db[_-]?url)\s*[=:]\s*["\']?(postgresql|mysql|mongodb)://[^"\'\s]+["\']?',
+    'smtp_password': r'(?i)smtp[_-]?password\s*[=:]\s*["\']?([^"\'\s]{6,})["\']?'
+}
+
+_VULNERABILITY_PATTERN_SOURCES = {
+    'sql_injection': {
+        'patterns': [
+            r'execute\s*\(\s*["\'].*\+.*["\']',  # String concatenation in SQL
+            r'cursor\.execute\s*\(\s*["\'][^"\']*%[^"\']*["\']',  # Python string formatting in SQL
+            r'query\s*=\s*["\'][^"\']*\+[^"\']*["\']',  # Query string concatenation
+            r'SELECT.*WHERE.*=.*\+',  # SQL concatenation
+        ],
+        'severity': 'high',
+        'cwe': 'CWE-89'
+    },
+    'xss': {
+        'patterns': [
+            r'innerHTML\s*=\s*[^;]+\+',  # JavaScript innerHTML with concatenation
+            r'document\.write\s*\(\s*[^)]*\+',  # document.write with concatenation
+            r'eval\s*\(\s*[^)]*\+',  # eval with concatenation
+            r'\$\{[^}]*user[^}]*\}',  # Template literal with user input
+        ],
+        'severity': 'high',
+        'cwe': 'CWE-79'
+    },
+    'command_injection': {
+        'patterns': [
+            r'os\.system\s*\(\s*[^)]*\+',  # os.system with concatenation
+            r'subprocess\.(call|run|Popen)\s*\(\s*[^)]*\+',  # subprocess with concatenation
+            r'exec\s*\(\s*[^)]*\+',  # exec with concatenation
+            r'shell_exec\s*\(\s*[^)]*\.\s*\$',  # PHP shell_exec with variables
+        ],
+        'severity': 'critical',
+        'cwe': 'CWE-78'
+    },
+    'path_traversal': {
+        'patterns': [
+            r'open\s*\(\s*[^)]*\+.*\.\./.*\)',  # File operations with path traversal
+            r'file_get_contents\s*\(\s*\$_[GET|POST]',  # PHP file operations with user input
+            r'readFile\s*\(\s*[^)]*\+',  # File read with concatenation
+        ],
+        'severity': 'high',
+        'cwe': 'CWE-22'
+    },
+    'insecure_deserialization': {
+        'patterns': [
+            r'pickle\.loads?\s*\(',  # Python pickle
+            r'yaml\.load\s*\(\s*[^,)]*\)',  # YAML load without safe_load
+            r'JSON\.parse\s*\(\s*[^)]*user',  # JSON parse with user input
+            r'unserialize\s*\(\s*\$_',  # PHP unserialize with user input
+        ],
+        'severity': 'high',
+        'cwe': 'CWE-502'
+    },
+    'weak_crypto': {
+        'patterns': [
+            r'hashlib\.(md5|sha1)\(',  # Weak hash functions
+            r'crypto\.createHash\s*\(\s*["\']md5["\']',  # Node.js weak hash
+            r'DES|RC4|MD5|SHA1',  # Weak encryption algorithms
+        ],
+        'severity': 'medium',
+        'cwe': 'CWE-327'
+    }
+}
+
+SECRET_PATTERNS = {
+    secret_type: re.compile(pattern)
+    for secret_type, pattern in _SECRET_PATTERN_SOURCES.items()
+}
+
+VULNERABILITY_PATTERNS = {
+    vuln_type: {**vuln_info, 'patterns': [re.compile(p, re.IGNORECASE) for p in vuln_info['patterns']]}
+    for vuln_type, vuln_info in _VULNERABILITY_PATTERN_SOURCES.items()
+}
+
+# Substrings and literals that mark a matched value as a placeholder
+PLACEHOLDER_SUBSTRINGS = (
+    'your_api_key', 'your_secret', 'changeme', 'replace_me', 'example',
+    'dummy', 'test', 'placeholder', 'xxx', 'yyy', 'zzz', '123456',
+    'password', 'secret', 'token', 'key'
+)
+PLACEHOLDER_LITERALS = frozenset(['""', "''", '[]', '{}', 'null', 'none', 'undefined'])
+
+# Pattern scan hits per (scan kind, content digest), without the file path, so
+# unchanged files are not rescanned when a repository is analysed again.
+# Scans run in worker threads, so cache access is serialised by a lock
+SCAN_CACHE_MAX_ENTRIES = 4096
+_scan_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
 class SecurityAgent(BaseAgent):
     """Agent for analyzing security vulnerabilities and compliance issues"""
     
@@ -16,84 +122,13 @@ class SecurityAgent(BaseAgent):
         self.secret_patterns = self._load_secret_patterns()
         self.vulnerability_patterns = self._load_vulnerability_patterns()
     
-    def _load_secret_patterns(self) -> Dict[str, str]:
+    def _load_secret_patterns(self) -> Dict[str, Pattern]:
         """Load patterns for detecting secrets and credentials"""
-        return {
-            'api_key': r'(?i)(api[_-]?key|apikey)\s*[=:]\s*["\']?([a-zA-Z0-9_\-]{20,})["\']?',
-            'secret_key': r'(?i)(secret[_-]?key|secretkey)\s*[=:]\s*["\']?([a-zA-Z0-9_\-]{20,})["\']?',
-            'password': r'(?i)(password|passwd|pwd)\s*[=:]\s*["\']?([^"\'\s]{8,})["\']?',
-            'token': r'(?i)(token|auth[_-]?token)\s*[=:]\s*["\']?([a-zA-Z0-9_\-\.]{20,})["\']?',
-            'private_key': r'-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----',
-            'aws_access_key': r'AKIA[0-9A-Z]{16}',
-            'aws_secret_key': r'(?i)aws[_-]?secret[_-]?access[_-]?key.*[=:]\s*["\']?([a-zA-Z0-9/+=]{40})["\']?',
-            'github_token': r'ghp_[a-zA-Z0-9]{36}',
-            'jwt_token': r'eyJ[a-zA-Z0-9_\-]*\.eyJ[a-zA-Z0-9_\-]*\.[a-zA-Z0-9_\-]*',
-            'database_url': r'(?i)(database[_-]?url|db[_-]?url)\s*[=:]\s*["\']?(postgresql|mysql|mongodb)://[^"\'\s]+["\']?',
-            'smtp_password': r'(?i)smtp[_-]?password\s*[=:]\s*["\']?([^"\'\s]{6,})["\']?'
-        }
+        return SECRET_PATTERNS
     
     def _load_vulnerability_patterns(self) -> Dict[str, Dict]:
         """Load patterns for detecting common vulnerabilities"""
-        return {
-            'sql_injection': {
-                'patterns': [
-                    r'execute\s*\(\s*["\'].*\+.*["\']',  # String concatenation in SQL
-                    r'cursor\.execute\s*\(\s*["\'][^"\']*%[^"\']*["\']',  # Python string formatting in SQL
-                    r'query\s*=\s*["\'][^"\']*\+[^"\']*["\']',  # Query string concatenation
-                    r'SELECT.*WHERE.*=.*\+',  # SQL concatenation
-                ],
-                'severity': 'high',
-                'cwe': 'CWE-89'
-            },
-            'xss': {
-                'patterns': [
-                    r'innerHTML\s*=\s*[^;]+\+',  # JavaScript innerHTML with concatenation
-                    r'document\.write\s*\(\s*[^)]*\+',  # document.write with concatenation
-                    r'eval\s*\(\s*[^)]*\+',  # eval with concatenation
-                    r'\$\{[^}]*user[^}]*\}',  # Template literal with user input
-                ],
-                'severity': 'high',
-                'cwe': 'CWE-79'
-            },
-            'command_injection': {
-                'patterns': [
-                    r'os\.system\s*\(\s*[^)]*\+',  # os.system with concatenation
-                    r'subprocess\.(call|run|Popen)\s*\(\s*[^)]*\+',  # subprocess with concatenation
-                    r'exec\s*\(\s*[^)]*\+',  # exec with concatenation
-                    r'shell_exec\s*\(\s*[^)]*\.\s*\$',  # PHP shell_exec with variables
-                ],
-                'severity': 'critical',
-                'cwe': 'CWE-78'
-            },
-            'path_traversal': {
-                'patterns': [
-                    r'open\s*\(\s*[^)]*\+.*\.\./.*\)',  # File operations with path traversal
-                    r'file_get_contents\s*\(\s*\$_[GET|POST]',  # PHP file operations with user input
-                    r'readFile\s*\(\s*[^)]*\+',  # File read with concatenation
-                ],
-                'severity': 'high',
-                'cwe': 'CWE-22'
-            },
-            'insecure_deserialization': {
-                'patterns': [
-                    r'pickle\.loads?\s*\(',  # Python pickle
-                    r'yaml\.load\s*\(\s*[^,)]*\)',  # YAML load without safe_load
-                    r'JSON\.parse\s*\(\s*[^)]*user',  # JSON parse with user input
-                    r'unserialize\s*\(\s*\$_',  # PHP unserialize with user input
-                ],
-                'severity': 'high',
-                'cwe': 'CWE-502'
-            },
-            'weak_crypto': {
-                'patterns': [
-                    r'hashlib\.(md5|sha1)\(',  # Weak hash functions
-                    r'crypto\.createHash\s*\(\s*["\']md5["\']',  # Node.js weak hash
-                    r'DES|RC4|MD5|SHA1',  # Weak encryption algorithms
-                ],
-                'severity': 'medium',
-                'cwe': 'CWE-327'
-            }
-        }
+        return VULNERABILITY_PATTERNS
     
     async def analyze(self, repo_path: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Analyze repository for security vulnerabilities"""
@@ -109,14 +144,17 @@ class SecurityAgent(BaseAgent):
                 summary="No files found to analyze for security issues"
             )
         
-        # Perform security analysis
-        secret_issues = await self._scan_for_secrets(code_files + config_files, repo_path)
-        vulnerability_issues = await self._scan_for_vulnerabilities(code_files, repo_path)
-        config_issues = await self._analyze_config_security(config_files, repo_path)
-        
-        # LLM analysis on sample files
+        # Only the LLM sample files stay in memory for the whole analysis; the
+        # scans read and release one file at a time
         sample_files = self._select_sample_files(code_files, max_files=3)
-        llm_issues = await self._analyze_with_llm(sample_files, repo_path)
+        samples = await asyncio.to_thread(self._read_files, sample_files)
+        
+        # Perform security analysis; the LLM requests on sample files are
+        # in flight while the pattern scans run
+        llm_issues, (secret_issues, vulnerability_issues, config_issues) = await asyncio.gather(
+            self._analyze_with_llm(sample_files, repo_path, samples),
+            asyncio.to_thread(self._scan_files, code_files, config_files, repo_path, samples)
+        )
         
         # Combine all issues
         all_issues = secret_issues + vulnerability_issues + config_issues + llm_issues
@@ -159,107 +197,144 @@ class SecurityAgent(BaseAgent):
         
         return config_files
     
-    async def _scan_for_secrets(self, files: List[str], repo_path: str) -> List[Dict]:
-        """Scan files for hardcoded secrets and credentials"""
-        issues = []
-        
+    def _read_files(self, files: List[str]) -> Dict[str, Optional[str]]:
+        """Read the content of each distinct file once"""
+        contents = {}
         for file_path in files:
-            try:
-                content = self.get_file_content(file_path)
-                if not content:
-                    continue
-                
-                relative_path = os.path.relpath(file_path, repo_path)
-                
-                for line_num, line in enumerate(content.split('\n'), 1):
-                    for secret_type, pattern in self.secret_patterns.items():
-                        matches = re.finditer(pattern, line)
-                        for match in matches:
-                            # Skip obvious placeholder values
-                            if self._is_placeholder_value(match.group()):
-                                continue
-                            
-                            issues.append({
-                                "file": relative_path,
-                                "line": line_num,
-                                "desc": f"Potential {secret_type.replace('_', ' ')} detected",
-                                "severity": "critical" if secret_type in ['private_key', 'aws_secret_key'] else "high",
-                                "cwe": "CWE-798",
-                                "pattern": secret_type
-                            })
+            if file_path not in contents:
+                contents[file_path] = self.get_file_content(file_path)
+        return contents
+    
+    def _scan_files(self, code_files: List[str], config_files: List[str], repo_path: str,
+                    samples: Dict[str, Optional[str]]) -> tuple:
+        """Read, scan and release each file in turn; called in a worker thread"""
+        secret_issues = []
+        vulnerability_issues = []
+        config_issues = []
+        
+        # Per-pattern fields don't depend on the match, so build them once
+        secret_checks = [
+            (secret_type, pattern.finditer, f"Potential {secret_type.replace('_', ' ')} detected",
+             "critical" if secret_type in ['private_key', 'aws_secret_key'] else "high")
+            for secret_type, pattern in self.secret_patterns.items()
+        ]
+        vuln_checks = [
+            (vuln_type, pattern.search, f"Potential {vuln_type.replace('_', ' ')} vulnerability",
+             vuln_info['severity'], vuln_info['cwe'])
+            for vuln_type, vuln_info in self.vulnerability_patterns.items()
+            for pattern in vuln_info['patterns']
+        ]
+        
+        # Code files get the secret and vulnerability scans, config files the
+        # secret scan and the misconfiguration checks
+        file_roles = [(file_path, True) for file_path in code_files]
+        file_roles.extend((file_path, False) for file_path in config_files)
+        
+        for file_path, is_code in file_roles:
+            content = samples.get(file_path) or self.get_file_content(file_path)
+            if not content:
+                continue
+            
+            relative_path = os.path.relpath(file_path, repo_path)
             
+            try:
+                hits = self._cached_scan('secrets', content, self._find_secrets, secret_checks)
+                secret_issues.extend({"file": relative_path, **hit} for hit in hits)
             except Exception as e:
                 self.logger.error(f"Error scanning file {file_path} for secrets: {e}")
+            
+            if is_code:
+                try:
+                    hits = self._cached_scan('vulnerabilities', content, self._find_vulnerabilities, vuln_checks)
+                    vulnerability_issues.extend({"file": relative_path, **hit} for hit in hits)
+                except Exception as e:
+                    self.logger.error(f"Error scanning file {file_path} for vulnerabilities: {e}")
+            else:
+                try:
+                    config_issues.extend(self._check_config_file(content, file_path, relative_path))
+                except Exception as e:
+                    self.logger.error(f"Error analyzing config file {file_path}: {e}")
         
-        return issues
+        return secret_issues, vulnerability_issues, config_issues
+    
+    def _find_secrets(self, content: str, secret_checks: List[tuple]) -> List[Dict]:
+        """Match the secret patterns against each line of one file"""
+        hits = []
+        append_hit = hits.append
+        is_placeholder = self._is_placeholder_value
+        
+        for line_num, line in enumerate(content.split('\n'), 1):
+            for secret_type, finditer, desc, severity in secret_checks:
+                for match in finditer(line):
+                    # Skip obvious placeholder values
+                    if is_placeholder(match.group()):
+                        continue
+                    
+                    append_hit({
+                        "line": line_num,
+                        "desc": desc,
+                        "severity": severity,
+                        "cwe": "CWE-798",
+                        "pattern": secret_type
+                    })
+        
+        return hits
+    
+    def _cached_scan(self, kind: str, content: str, scan, checks: List[tuple]) -> List[Dict]:
+        """Run a pattern scan over file content, reusing hits for content already scanned"""
+        key = (kind, hashlib.blake2b(content.encode('utf-8', errors='surrogatepass'), digest_size=16).digest())
+        with _scan_cache_lock:
+            hits = _scan_cache.get(key)
+            if hits is not None:
+                _scan_cache.move_to_end(key)
+                return hits
+        
+        hits = scan(content, checks)
+        with _scan_cache_lock:
+            _scan_cache[key] = hits
+            if len(_scan_cache) > SCAN_CACHE_MAX_ENTRIES:
+                _scan_cache.popitem(last=False)
+        return hits
     
     def _is_placeholder_value(self, value: str) -> bool:
         """Check if a value is likely a placeholder rather than a real secret"""
-        placeholders = [
-            'your_api_key', 'your_secret', 'changeme', 'replace_me', 'example',
-            'dummy', 'test', 'placeholder', 'xxx', 'yyy', 'zzz', '123456',
-            'password', 'secret', 'token', 'key'
-        ]
-        
         value_lower = value.lower()
         return (len(value) < 8 or 
-                any(placeholder in value_lower for placeholder in placeholders) or
-                value in ['""', "''", '[]', '{}', 'null', 'none', 'undefined'])
+                any(placeholder in value_lower for placeholder in PLACEHOLDER_SUBSTRINGS) or
+                value in PLACEHOLDER_LITERALS)
     
-    async def _scan_for_vulnerabilities(self, files: List[str], repo_path: str) -> List[Dict]:
-        """Scan code files for common vulnerability patterns"""
-        issues = []
+    def _find_vulnerabilities(self, content: str, vuln_checks: List[tuple]) -> List[Dict]:
+        """Match the vulnerability patterns against each line of one file"""
+        hits = []
+        append_hit = hits.append
+        # Split once per file rather than once per pattern
+        lines = content.split('\n')
         
-        for file_path in files:
-            try:
-                content = self.get_file_content(file_path)
-                if not content:
-                    continue
-                
-                relative_path = os.path.relpath(file_path, repo_path)
-                
-                for vuln_type, vuln_info in self.vulnerability_patterns.items():
-                    for pattern in vuln_info['patterns']:
-                        for line_num, line in enumerate(content.split('\n'), 1):
-                            if re.search(pattern, line, re.IGNORECASE):
-                                issues.append({
-                                    "file": relative_path,
-                                    "line": line_num,
-                                    "desc": f"Potential {vuln_type.replace('_', ' ')} vulnerability",
-                                    "severity": vuln_info['severity'],
-                                    "cwe": vuln_info['cwe'],
-                                    "pattern": vuln_type
-                                })
-            
-            except Exception as e:
-                self.logger.error(f"Error scanning file {file_path} for vulnerabilities: {e}")
+        for vuln_type, search, desc, severity, cwe in vuln_checks:
+            for line_num, line in enumerate(lines, 1):
+                if search(line):
+                    append_hit({
+                        "line": line_num,
+                        "desc": desc,
+                        "severity": severity,
+                        "cwe": cwe,
+                        "pattern": vuln_type
+                    })
         
-        return issues
+        return hits
     
-    async def _analyze_config_security(self, config_files: List[str], repo_path: str) -> List[Dict]:
-        """Analyze configuration files for security issues"""
+    def _check_config_file(self, content: str, file_path: str, relative_path: str) -> List[Dict]:
+        """Check one configuration file for common misconfigurations"""
         issues = []
         
-        for file_path in config_files:
-            try:
-                content = self.get_file_content(file_path)
-                if not content:
-                    continue
-                
-                relative_path = os.path.relpath(file_path, repo_path)
-                
-                # Check for common misconfigurations
-                if 'docker' in file_path.lower():
-                    issues.extend(self._check_docker_security(content, relative_path))
-                
-                if '.env' in file_path:
-                    issues.extend(self._check_env_security(content, relative_path))
-                
-                if file_path.endswith(('.yml', '.yaml')):
-                    issues.extend(self._check_yaml_security(content, relative_path))
-            
-            except Exception as e:
-                self.logger.error(f"Error analyzing config file {file_path}: {e}")
+        if 'docker' in file_path.lower():
+            issues.extend(self._check_docker_security(content, relative_path))
+        
+        if '.env' in file_path:
+            issues.extend(self._check_env_security(content, relative_path))
+        
+        if file_path.endswith(('.yml', '.yaml')):
+            issues.extend(self._check_yaml_security(content, relative_path))
         
         return issues
     
@@ -386,31 +461,39 @@ class SecurityAgent(BaseAgent):
         
         return result
     
-    async def _analyze_with_llm(self, sample_files: List[str], repo_path: str) -> List[Dict]:
+    async def _analyze_with_llm(self, sample_files: List[str], repo_path: str,
+                                contents: Dict[str, Optional[str]]) -> List[Dict]:
         """Use LLM for security analysis"""
+        results = await asyncio.gather(
+            *(self._analyze_file_with_llm(file_path, repo_path, contents.get(file_path))
+              for file_path in sample_files)
+        )
+        return [issue for file_issues in results for issue in file_issues]
+    
+    async def _analyze_file_with_llm(self, file_path: str, repo_path: str,
+                                     content: Optional[str]) -> List[Dict]:
+        """Run the LLM security analysis for a single file"""
         issues = []
         
-        for file_path in sample_files:
-            try:
-                content = self.get_file_content(file_path)
-                if not content:
-                    continue
-                
-                relative_path = os.path.relpath(file_path, repo_path)
-                
-                result = await self.llm_provider.analyze_code(
-                    content,
-                    "security",
-                    {"file_path": relative_path, "file_type": Path(file_path).suffix}
-                )
-                
-                if "issues" in result:
-                    for issue in result["issues"]:
-                        issue["file"] = relative_path
-                        issues.append(issue)
+        try:
+            if not content:
+                return issues
             
-            except Exception as e:
-                self.logger.error(f"Error in LLM security analysis for {file_path}: {e}")
+            relative_path = os.path.relpath(file_path, repo_path)
+            
+            result = await self.llm_provider.analyze_code(
+                content,
+                "security",
+                {"file_path": relative_path, "file_type": Path(file_path).suffix}
+            )
+            
+            if "issues" in result:
+                for issue in result["issues"]:
+                    issue["file"] = relative_path
+                    issues.append(issue)
+        
+        except Exception as e:
+            self.logger.error(f"Error in LLM security analysis for {file_path}: {e}")
         
         return issues
     
@@ -433,15 +516,8 @@ class SecurityAgent(BaseAgent):
         recommendations = []
         
         # Categorize issues
-        issue_types = {}
-        severity_counts = {}
-        
-        for issue in issues:
-            issue_type = issue.get("pattern", "other")
-            severity = issue.get("severity", "low")
-            
-            issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        issue_types = Counter(issue.get("pattern", "other") for issue in issues)
+        severity_counts = Counter(issue.get("severity", "low") for issue in issues)
         
         # Generate specific recommendations
         if severity_counts.get("critical", 0) > 0:
@@ -469,10 +545,7 @@ class SecurityAgent(BaseAgent):
     
     def _generate_summary(self, score: int, issues: List[Dict], total_files: int) -> str:
         """Generate security analysis summary"""
-        severity_counts = {}
-        for issue in issues:
-            severity = issue.get("severity", "low")
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        severity_counts = Counter(issue.get("severity", "low") for issue in issues)
         
         summary = f"Security analysis of {total_files} files completed with score {score}/100. "
         
@@ -2,14 +2,19 @@
 Static Tool Integration Agent - Runs conventional static tools and explains results with LLM reasoning
 """
 import os
+import asyncio
 import subprocess
 import json
+import orjson
 import tempfile
 import re
+from collections import Counter
 from typing import Dict, Any, List, Optional, Tuple
-from pathlib import Path
 from .base_agent import BaseAgent
 
+# TypeScript compiler error format: file.ts(line,column): error message
+TSC_ERROR_PATTERN = re.compile(r'(.+?)\((\d+),(\d+)\): (.+)')
+
 class StaticToolAgent(BaseAgent):
     """Agent for running and analyzing static analysis tools"""
     
@@ -49,22 +54,26 @@ class StaticToolAgent(BaseAgent):
                 summary="No supported languages detected for static analysis"
             )
         
-        # Run static analysis tools for each language
+        # Run static analysis tools for each language; the languages are
+        # independent, so their tool runs overlap
         all_results = {}
         all_issues = []
         
-        for language in project_languages:
-            try:
-                language_results = await self._analyze_language(repo_path, language)
-                all_results[language] = language_results
-                all_issues.extend(language_results.get('issues', []))
-            
-            except Exception as e:
-                self.logger.error(f"Error analyzing {language}: {e}")
+        language_outcomes = await asyncio.gather(
+            *[self._analyze_language(repo_path, language) for language in project_languages],
+            return_exceptions=True
+        )
+        
+        for language, outcome in zip(project_languages, language_outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error analyzing {language}: {outcome}")
                 all_issues.append({
-                    "desc": f"Failed to analyze {language} files: {str(e)}",
+                    "desc": f"Failed to analyze {language} files: {str(outcome)}",
                     "severity": "low"
                 })
+            else:
+                all_results[language] = outcome
+                all_issues.extend(outcome.get('issues', []))
         
         # LLM analysis to explain and group results
         summary_analysis = await self._analyze_results_with_llm(all_results, repo_path)
@@ -93,7 +102,7 @@ class StaticToolAgent(BaseAgent):
             dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']]
             
             for file in files:
-                ext = Path(file).suffix.lower()
+                ext = os.path.splitext(file)[1].lower()
                 if ext:
                     extension_counts[ext] = extension_counts.get(ext, 0) + 1
         
@@ -131,41 +140,36 @@ class StaticToolAgent(BaseAgent):
         
         tools_config = self.tools_config.get(language, {})
         
-        # Run linters
-        for linter in tools_config.get('linters', []):
-            try:
-                linter_result = await self._run_linter(repo_path, language, linter)
-                if linter_result:
-                    results['tools_run'].append(linter)
-                    results['tool_results'][linter] = linter_result
-                    results['issues'].extend(linter_result.get('issues', []))
-            except Exception as e:
-                self.logger.error(f"Error running {linter}: {e}")
-        
-        # Run type checkers
-        for type_checker in tools_config.get('type_checkers', []):
-            try:
-                type_result = await self._run_type_checker(repo_path, language, type_checker)
-                if type_result:
-                    results['tools_run'].append(type_checker)
-                    results['tool_results'][type_checker] = type_result
-                    results['issues'].extend(type_result.get('issues', []))
-            except Exception as e:
-                self.logger.error(f"Error running {type_checker}: {e}")
-        
-        # Run security tools
-        for security_tool in tools_config.get('security', []):
-            try:
-                security_result = await self._run_security_tool(repo_path, language, security_tool)
-                if security_result:
-                    results['tools_run'].append(security_tool)
-                    results['tool_results'][security_tool] = security_result
-                    results['issues'].extend(security_result.get('issues', []))
-            except Exception as e:
-                self.logger.error(f"Error running {security_tool}: {e}")
+        # Each tool runs in its own subprocess, so start them all at once
+        # instead of waiting for one to finish before launching the next
+        tool_runs = (
+            [(linter, self._run_linter(repo_path, language, linter))
+             for linter in tools_config.get('linters', [])] +
+            [(type_checker, self._run_type_checker(repo_path, language, type_checker))
+             for type_checker in tools_config.get('type_checkers', [])] +
+            [(security_tool, self._run_security_tool(repo_path, language, security_tool))
+             for security_tool in tools_config.get('security', [])]
+        )
+        tool_results = await asyncio.gather(
+            *(run for _, run in tool_runs), return_exceptions=True
+        )
+        
+        for (tool, _), tool_result in zip(tool_runs, tool_results):
+            if isinstance(tool_result, Exception):
+                self.logger.error(f"Error running {tool}: {tool_result}")
+            elif tool_result:
+                results['tools_run'].append(tool)
+                results['tool_results'][tool] = tool_result
+                results['issues'].extend(tool_result.get('issues', []))
         
         return results
     
+    async def _run_command(self, cmd: List[str], repo_path: str, timeout: int) -> subprocess.CompletedProcess:
+        """Run a tool command in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(
+            subprocess.run, cmd, cwd=repo_path, capture_output=True, text=True, timeout=timeout
+        )
+    
     async def _run_linter(self, repo_path: str, language: str, linter: str) -> Optional[Dict[str, Any]]:
         """Run a linter tool"""
         if language == 'python' and linter == 'flake8':
@@ -188,9 +192,7 @@ class StaticToolAgent(BaseAgent):
             # Run flake8 with JSON-like output
             cmd = ['flake8', '--format=json'] + [os.path.relpath(f, repo_path) for f in python_files[:10]]
             
-            result = subprocess.run(
-                cmd, cwd=repo_path, capture_output=True, text=True, timeout=60
-            )
+            result = await self._run_command(cmd, repo_path, timeout=60)
             
             issues = []
             if result.stdout:
@@ -251,14 +253,12 @@ class StaticToolAgent(BaseAgent):
             # Run pylint with JSON output
             cmd = ['pylint', '--output-format=json', '--exit-zero'] + [os.path.relpath(f, repo_path) for f in python_files[:5]]
             
-            result = subprocess.run(
-                cmd, cwd=repo_path, capture_output=True, text=True, timeout=120
-            )
+            result = await self._run_command(cmd, repo_path, timeout=120)
             
             issues = []
             if result.stdout:
                 try:
-                    pylint_data = json.loads(result.stdout)
+                    pylint_data = orjson.loads(result.stdout)
                     for item in pylint_data:
                         severity = self._map_pylint_severity(item.get('type', ''))
                         issues.append({
@@ -319,20 +319,18 @@ class StaticToolAgent(BaseAgent):
                 }
                 
                 config_path = os.path.join(repo_path, '.eslintrc.json')
-                with open(config_path, 'w') as f:
-                    json.dump(basic_config, f, indent=2)
+                with open(config_path, 'wb') as f:
+                    f.write(orjson.dumps(basic_config, option=orjson.OPT_INDENT_2))
             
             # Run ESLint
             cmd = ['eslint', '--format=json'] + [os.path.relpath(f, repo_path) for f in js_files[:10]]
             
-            result = subprocess.run(
-                cmd, cwd=repo_path, capture_output=True, text=True, timeout=60
-            )
+            result = await self._run_command(cmd, repo_path, timeout=60)
             
             issues = []
             if result.stdout:
                 try:
-                    eslint_data = json.loads(result.stdout)
+                    eslint_data = orjson.loads(result.stdout)
                     for file_result in eslint_data:
                         file_path = file_result.get('filePath', '')
                         for message in file_result.get('messages', []):
@@ -384,9 +382,7 @@ class StaticToolAgent(BaseAgent):
             # Run mypy with JSON output
             cmd = ['mypy', '--show-error-codes', '--no-error-summary'] + [os.path.relpath(f, repo_path) for f in python_files[:5]]
             
-            result = subprocess.run(
-                cmd, cwd=repo_path, capture_output=True, text=True, timeout=90
-            )
+            result = await self._run_command(cmd, repo_path, timeout=90)
             
             issues = []
             if result.stdout:
@@ -427,16 +423,14 @@ class StaticToolAgent(BaseAgent):
             # Run tsc with no emit to just check types
             cmd = ['tsc', '--noEmit', '--pretty', 'false']
             
-            result = subprocess.run(
-                cmd, cwd=repo_path, capture_output=True, text=True, timeout=60
-            )
+            result = await self._run_command(cmd, repo_path, timeout=60)
             
             issues = []
             if result.stdout:
                 for line in result.stdout.strip().split('\n'):
                     if '(' in line and ')' in line and ':' in line:
                         # Parse TypeScript error format: file.ts(line,column): error message
-                        match = re.search(r'(.+?)\((\d+),(\d+)\): (.+)', line)
+                        match = TSC_ERROR_PATTERN.search(line)
                         if match:
                             file_path, line_num, col, message = match.groups()
                             
@@ -474,14 +468,12 @@ class StaticToolAgent(BaseAgent):
             # Run bandit with JSON output
             cmd = ['bandit', '-f', 'json', '-r', '.']
             
-            result = subprocess.run(
-                cmd, cwd=repo_path, capture_output=True, text=True, timeout=60
-            )
+            result = await self._run_command(cmd, repo_path, timeout=60)
             
             issues = []
             if result.stdout:
                 try:
-                    bandit_data = json.loads(result.stdout)
+                    bandit_data = orjson.loads(result.stdout)
                     for finding in bandit_data.get('results', []):
                         severity = self._map_bandit_severity(finding.get('issue_severity', 'LOW'))
                         
@@ -531,10 +523,9 @@ class StaticToolAgent(BaseAgent):
                 summary_text += f"Issues found: {len(results.get('issues', []))}\n"
                 
                 # Group issues by severity
-                severity_counts = {}
-                for issue in results.get('issues', []):
-                    severity = issue.get('severity', 'low')
-                    severity_counts[severity] = severity_counts.get(severity, 0) + 1
+                severity_counts = Counter(
+                    issue.get('severity', 'low') for issue in results.get('issues', [])
+                )
                 
                 if severity_counts:
                     severity_summary = ', '.join([f"{count} {severity}" for severity, count in severity_counts.items()])
@@ -644,10 +635,7 @@ class StaticToolAgent(BaseAgent):
             all_issues.extend(results.get('issues', []))
         
         if all_issues:
-            severity_counts = {}
-            for issue in all_issues:
-                severity = issue.get('severity', 'low')
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
+            severity_counts = Counter(issue.get('severity', 'low') for issue in all_issues)
             
             severity_parts = []
             for severity in ['critical', 'high', 'medium', 'low']:
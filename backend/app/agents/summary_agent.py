@@ -1,11 +1,54 @@
 """
 Summary & Scoring Agent - Aggregates results from all agents and generates unified reports
 """
-import json
+import orjson
+import heapq
+import bisect
+from collections import Counter
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from .base_agent import BaseAgent
 
+# Lower score bound of each grade above F, and the grades in the same order
+GRADE_CUTOFFS = (60, 70, 80, 90)
+GRADES = (
+    ("F", "Poor"),
+    ("D", "Needs Improvement"),
+    ("C", "Satisfactory"),
+    ("B", "Good"),
+    ("A", "Excellent")
+)
+
+# Severity rank, used both for ordering issues and as the issue priority multiplier
+SEVERITY_RANK = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
+
+SEVERITY_EMOJI = {"critical": "🚨", "high": "⚠️", "medium": "⚡", "low": "ℹ️"}
+
+# Category importance when prioritizing suggestions
+SUGGESTION_CATEGORY_MULTIPLIERS = {
+    "Security": 2.0,
+    "Quality": 1.5,
+    "Testing": 1.3,
+    "Architecture": 1.2,
+    "Documentation": 1.0,
+    "Dependencies": 1.4,
+    "Static Checks": 1.0
+}
+
+# Category importance when prioritizing issues
+ISSUE_CATEGORY_MULTIPLIERS = {
+    "Security": 2.0,
+    "Quality": 1.2,
+    "Testing": 1.1,
+    "Architecture": 1.3,
+    "Documentation": 0.8,
+    "Dependencies": 1.5,
+    "Static Checks": 1.0
+}
+
+HIGH_PRIORITY_KEYWORDS = ('critical', 'security', 'vulnerability', 'urgent', 'immediate', 'fix')
+MEDIUM_PRIORITY_KEYWORDS = ('improve', 'enhance', 'add', 'implement', 'consider')
+
 class SummaryAgent(BaseAgent):
     """Agent for aggregating and summarizing results from all other agents"""
     
@@ -33,7 +76,7 @@ class SummaryAgent(BaseAgent):
         category_breakdown = self._create_category_breakdown(agent_results)
         
         # Generate insights and recommendations
-        insights = self._generate_insights(agent_results, overall_score)
+        insights = self._generate_insights(agent_results, overall_score, category_breakdown)
         recommendations = self._generate_recommendations(agent_results, overall_score)
         
         # Create executive summary
@@ -53,7 +96,9 @@ class SummaryAgent(BaseAgent):
         )
         
         # Generate detailed report
-        detailed_report = self._create_detailed_report(agent_results, repo_path)
+        detailed_report = self._create_detailed_report(
+            agent_results, repo_path, overall_score, category_breakdown
+        )
         
         return {
             "overall_score": overall_score,
@@ -111,7 +156,8 @@ class SummaryAgent(BaseAgent):
         
         return category_scores
     
-    def _generate_insights(self, agent_results: Dict[str, Dict[str, Any]], overall_score: int) -> List[str]:
+    def _generate_insights(self, agent_results: Dict[str, Dict[str, Any]], overall_score: int,
+                          category_breakdown: Dict[str, int]) -> List[str]:
         """Generate key insights from the analysis"""
         insights = []
         
@@ -127,10 +173,7 @@ class SummaryAgent(BaseAgent):
         else:
             insights.append("🚨 Significant quality issues detected - immediate attention required.")
         
-        # Category-specific insights
-        category_breakdown = self._create_category_breakdown(agent_results)
-        
-        # Find strongest and weakest areas
+        # Category-specific insights: find strongest and weakest areas
         if category_breakdown:
             best_category = max(category_breakdown.items(), key=lambda x: x[1])
             worst_category = min(category_breakdown.items(), key=lambda x: x[1])
@@ -254,17 +297,7 @@ class SummaryAgent(BaseAgent):
         base_priority = 5
         
         # Category importance multiplier
-        category_multipliers = {
-            "Security": 2.0,
-            "Quality": 1.5,
-            "Testing": 1.3,
-            "Architecture": 1.2,
-            "Documentation": 1.0,
-            "Dependencies": 1.4,
-            "Static Checks": 1.0
-        }
-        
-        multiplier = category_multipliers.get(category, 1.0)
+        multiplier = SUGGESTION_CATEGORY_MULTIPLIERS.get(category, 1.0)
         
         # Score-based adjustment (lower scores = higher priority)
         if score < 40:
@@ -277,14 +310,11 @@ class SummaryAgent(BaseAgent):
             score_adjustment = 0
         
         # Keyword-based priority boost
-        high_priority_keywords = ['critical', 'security', 'vulnerability', 'urgent', 'immediate', 'fix']
-        medium_priority_keywords = ['improve', 'enhance', 'add', 'implement', 'consider']
-        
         suggestion_lower = suggestion.lower()
         
-        if any(keyword in suggestion_lower for keyword in high_priority_keywords):
+        if any(keyword in suggestion_lower for keyword in HIGH_PRIORITY_KEYWORDS):
             keyword_boost = 2
-        elif any(keyword in suggestion_lower for keyword in medium_priority_keywords):
+        elif any(keyword in suggestion_lower for keyword in MEDIUM_PRIORITY_KEYWORDS):
             keyword_boost = 1
         else:
             keyword_boost = 0
@@ -301,45 +331,31 @@ class SummaryAgent(BaseAgent):
         summary_parts.append(f"Overall code quality score: {overall_score}/100")
         
         # Score interpretation
-        if overall_score >= 90:
-            grade = "A"
-            assessment = "Excellent"
-        elif overall_score >= 80:
-            grade = "B"
-            assessment = "Good"
-        elif overall_score >= 70:
-            grade = "C"
-            assessment = "Satisfactory"
-        elif overall_score >= 60:
-            grade = "D"
-            assessment = "Needs Improvement"
-        else:
-            grade = "F"
-            assessment = "Poor"
+        grade, assessment = GRADES[bisect.bisect_right(GRADE_CUTOFFS, overall_score)]
         
         summary_parts.append(f"Quality Grade: {grade} ({assessment})")
         
         # Category highlights
         if category_breakdown:
-            best_categories = sorted(category_breakdown.items(), key=lambda x: x[1], reverse=True)
-            worst_categories = sorted(category_breakdown.items(), key=lambda x: x[1])
+            best_category = max(category_breakdown.items(), key=lambda x: x[1])
+            worst_category = min(category_breakdown.items(), key=lambda x: x[1])
             
-            if best_categories[0][1] >= 85:
-                summary_parts.append(f"Strongest area: {best_categories[0][0]} ({best_categories[0][1]}/100)")
+            if best_category[1] >= 85:
+                summary_parts.append(f"Strongest area: {best_category[0]} ({best_category[1]}/100)")
             
-            if worst_categories[0][1] < 60:
-                summary_parts.append(f"Needs attention: {worst_categories[0][0]} ({worst_categories[0][1]}/100)")
+            if worst_category[1] < 60:
+                summary_parts.append(f"Needs attention: {worst_category[0]} ({worst_category[1]}/100)")
         
         # Issue count summary
         total_issues = sum(len(result.get('issues', [])) for result in agent_results.values())
-        critical_issues = sum(
-            len([i for i in result.get('issues', []) if i.get('severity') == 'critical'])
-            for result in agent_results.values()
-        )
-        high_issues = sum(
-            len([i for i in result.get('issues', []) if i.get('severity') == 'high'])
+        # One pass over all issues instead of a filtered list per severity
+        severity_counts = Counter(
+            issue.get('severity')
             for result in agent_results.values()
+            for issue in result.get('issues', [])
         )
+        critical_issues = severity_counts['critical']
+        high_issues = severity_counts['high']
         
         if critical_issues > 0:
             summary_parts.append(f"🚨 {critical_issues} critical issues requiring immediate attention")
@@ -366,9 +382,8 @@ class SummaryAgent(BaseAgent):
                 all_issues.append(enhanced_issue)
         
         # Sort by priority score (descending) and then by severity
-        severity_order = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
         all_issues.sort(
-            key=lambda x: (x['priority_score'], severity_order.get(x.get('severity', 'low'), 1)),
+            key=lambda x: (x['priority_score'], SEVERITY_RANK.get(x.get('severity', 'low'), 1)),
             reverse=True
         )
         
@@ -379,20 +394,10 @@ class SummaryAgent(BaseAgent):
         base_score = 5
         
         # Severity multiplier
-        severity_multipliers = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-        severity_multiplier = severity_multipliers.get(issue.get('severity', 'low'), 1)
+        severity_multiplier = SEVERITY_RANK.get(issue.get('severity', 'low'), 1)
         
         # Category importance
-        category_multipliers = {
-            "Security": 2.0,
-            "Quality": 1.2,
-            "Testing": 1.1,
-            "Architecture": 1.3,
-            "Documentation": 0.8,
-            "Dependencies": 1.5,
-            "Static Checks": 1.0
-        }
-        category_multiplier = category_multipliers.get(category, 1.0)
+        category_multiplier = ISSUE_CATEGORY_MULTIPLIERS.get(category, 1.0)
         
         return int(base_score * severity_multiplier * category_multiplier)
     
@@ -447,17 +452,9 @@ class SummaryAgent(BaseAgent):
                              all_issues: List[Dict[str, Any]], trends: Dict[str, Any]) -> Dict[str, Any]:
         """Create data structure optimized for dashboard visualization"""
         
-        # Severity distribution
-        severity_distribution = {}
-        for issue in all_issues:
-            severity = issue.get('severity', 'low')
-            severity_distribution[severity] = severity_distribution.get(severity, 0) + 1
-        
-        # Category distribution
-        category_distribution = {}
-        for issue in all_issues:
-            category = issue.get('category', 'Other')
-            category_distribution[category] = category_distribution.get(category, 0) + 1
+        # Severity and category distributions; plain dicts keep the result JSON-friendly
+        severity_distribution = dict(Counter(issue.get('severity', 'low') for issue in all_issues))
+        category_distribution = dict(Counter(issue.get('category', 'Other') for issue in all_issues))
         
         # Score ranges for visualization
         score_ranges = {
@@ -489,11 +486,12 @@ class SummaryAgent(BaseAgent):
                 "critical_issues": severity_distribution.get('critical', 0),
                 "high_issues": severity_distribution.get('high', 0),
                 "categories_analyzed": len(category_breakdown),
-                "improvement_areas": len([s for s in category_breakdown.values() if s < 70])
+                "improvement_areas": sum(1 for s in category_breakdown.values() if s < 70)
             }
         }
     
-    def _create_detailed_report(self, agent_results: Dict[str, Dict[str, Any]], repo_path: str) -> str:
+    def _create_detailed_report(self, agent_results: Dict[str, Dict[str, Any]], repo_path: str,
+                                overall_score: int, category_breakdown: Dict[str, int]) -> str:
         """Create detailed markdown report"""
         report_lines = []
         
@@ -507,9 +505,6 @@ class SummaryAgent(BaseAgent):
         ])
         
         # Overall Score
-        overall_score = self._calculate_overall_score(agent_results)
-        category_breakdown = self._create_category_breakdown(agent_results)
-        
         report_lines.extend([
             "## 📊 Overall Results",
             "",
@@ -563,8 +558,7 @@ class SummaryAgent(BaseAgent):
                 
                 for severity in ['critical', 'high', 'medium', 'low']:
                     if severity in severity_groups:
-                        severity_emoji = {"critical": "🚨", "high": "⚠️", "medium": "⚡", "low": "ℹ️"}
-                        report_lines.append(f"**{severity_emoji.get(severity, '')} {severity.title()} Severity:**")
+                        report_lines.append(f"**{SEVERITY_EMOJI.get(severity, '')} {severity.title()} Severity:**")
                         report_lines.append("")
                         
                         for issue in severity_groups[severity][:10]:  # Limit to 10 per severity
@@ -595,22 +589,24 @@ class SummaryAgent(BaseAgent):
         """Generate additional insights using LLM"""
         try:
             # Prepare summary data for LLM analysis
+            all_issues = aggregated_results["all_issues"]
+            severity_counts = Counter(issue.get('severity') for issue in all_issues)
             summary_data = {
                 "overall_score": aggregated_results["overall_score"],
                 "category_breakdown": aggregated_results["category_breakdown"],
-                "total_issues": len(aggregated_results["all_issues"]),
-                "critical_issues": len([i for i in aggregated_results["all_issues"] if i.get('severity') == 'critical']),
-                "high_issues": len([i for i in aggregated_results["all_issues"] if i.get('severity') == 'high']),
-                "top_categories": sorted(
-                    aggregated_results["category_breakdown"].items(), 
-                    key=lambda x: x[1], reverse=True
-                )[:3]
+                "total_issues": len(all_issues),
+                "critical_issues": severity_counts['critical'],
+                "high_issues": severity_counts['high'],
+                "top_categories": heapq.nlargest(
+                    3, aggregated_results["category_breakdown"].items(),
+                    key=lambda x: x[1]
+                )
             }
             
             prompt = f"""
             Based on this code quality analysis summary, provide strategic insights and actionable recommendations:
             
-            {json.dumps(summary_data, indent=2)}
+            {orjson.dumps(summary_data, option=orjson.OPT_INDENT_2).decode()}
             
             Please provide:
             1. Strategic assessment of the codebase health
@@ -7,7 +7,7 @@ import logging
 import time
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, ast_cache_scope
 from .code_quality_agent import CodeQualityAgent
 from .security_agent import SecurityAgent
 from .architecture_agent import ArchitectureAgent
@@ -16,6 +16,67 @@ from .dependency_agent import DependencyAgent
 from .static_tool_agent import StaticToolAgent
 from .summary_agent import SummaryAgent
 
+# Source file extensions used to detect the primary languages of a repository
+LANGUAGE_MAPPINGS = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.cs': 'C#',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin'
+}
+
+# Directories whose files are not counted towards language detection
+NON_SOURCE_DIRS = frozenset(['.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'])
+
+# Keys every agent result must provide
+REQUIRED_RESULT_FIELDS = frozenset(['agent', 'category', 'score', 'issues', 'suggestions', 'summary'])
+
+# Special configuration and project files; patterns ending in '/' are directories
+SPECIAL_FILE_PATTERNS = {
+    'dependency_files': [
+        'requirements.txt', 'package.json', 'pom.xml', 'build.gradle', 
+        'Gemfile', 'composer.json', 'go.mod', 'Cargo.toml', 'pyproject.toml'
+    ],
+    'config_files': [
+        '.env', 'config.json', 'settings.json', '.gitignore', 
+        'tsconfig.json', 'webpack.config.js', 'babel.config.js'
+    ],
+    'documentation_files': [
+        'README.md', 'README.rst', 'CHANGELOG.md', 'CONTRIBUTING.md', 
+        'LICENSE', 'docs/', 'documentation/'
+    ],
+    'ci_files': [
+        '.github/', '.gitlab-ci.yml', 'Jenkinsfile', '.travis.yml', 
+        'azure-pipelines.yml', '.circleci/'
+    ],
+    'container_files': [
+        'Dockerfile', 'docker-compose.yml', '.dockerignore', 'kubernetes/'
+    ]
+}
+
+# Entry name -> (declaration rank, category, name), split into files and directories
+_special_patterns = list(enumerate(
+    (category, pattern) for category, patterns in SPECIAL_FILE_PATTERNS.items() for pattern in patterns
+))
+SPECIAL_FILE_INDEX = {
+    pattern: (rank, category, pattern)
+    for rank, (category, pattern) in _special_patterns if not pattern.endswith('/')
+}
+SPECIAL_DIR_INDEX = {
+    pattern.rstrip('/'): (rank, category, pattern.rstrip('/'))
+    for rank, (category, pattern) in _special_patterns if pattern.endswith('/')
+}
+
 class SupervisorAgent(BaseAgent):
     """Master agent that orchestrates all other analysis agents"""
     
@@ -34,6 +95,16 @@ class SupervisorAgent(BaseAgent):
         
         self.summary_agent = SummaryAgent(llm_provider)
         
+        # The agent set is fixed after construction, so derive its metadata once
+        self._available_agents = tuple(self.agents.keys())
+        self._agent_details = {
+            name: {
+                'name': agent.name,
+                'category': agent.category
+            }
+            for name, agent in self.agents.items()
+        }
+        
         # Configuration
         self.max_concurrent_agents = 3  # Limit concurrent execution
         self.agent_timeout = 300  # 5 minutes per agent
@@ -57,7 +128,8 @@ class SupervisorAgent(BaseAgent):
         analysis_context = self._prepare_analysis_context(repo_path, context)
         
         # Run agents with orchestration
-        agent_results = await self._orchestrate_agents(repo_path, analysis_context)
+        with ast_cache_scope():
+            agent_results = await self._orchestrate_agents(repo_path, analysis_context)
         
         # Generate summary and aggregated results
         aggregated_results = self.summary_agent.aggregate_results(agent_results, repo_path, analysis_context)
@@ -80,7 +152,7 @@ class SupervisorAgent(BaseAgent):
                 'timestamp': datetime.utcnow().isoformat(),
                 'supervisor_version': '1.0',
                 'total_agents': len(self.agents),
-                'successful_agents': len([r for r in agent_results.values() if not r.get('error')]),
+                'successful_agents': sum(1 for r in agent_results.values() if not r.get('error')),
                 'repository_stats': analysis_context.get('repository_stats', {})
             },
             **aggregated_results
@@ -113,16 +185,10 @@ class SupervisorAgent(BaseAgent):
         """Prepare analysis context with repository information"""
         analysis_context = context.copy() if context else {}
         
-        # Get repository statistics
-        repo_stats = self._get_repository_stats(repo_path)
+        # Statistics, languages and special files all come from one walk
+        repo_stats, languages, special_files = self._scan_repository(repo_path)
         analysis_context['repository_stats'] = repo_stats
-        
-        # Detect primary languages
-        languages = self._detect_primary_languages(repo_path)
         analysis_context['primary_languages'] = languages
-        
-        # Check for special files/configurations
-        special_files = self._detect_special_files(repo_path)
         analysis_context['special_files'] = special_files
         
         # Set analysis preferences based on repository characteristics
@@ -132,8 +198,14 @@ class SupervisorAgent(BaseAgent):
         
         return analysis_context
     
-    def _get_repository_stats(self, repo_path: str) -> Dict[str, Any]:
-        """Get basic repository statistics"""
+    def _scan_repository(self, repo_path: str) -> Tuple[Dict[str, Any], List[str], Dict[str, List[str]]]:
+        """
+        Walk the repository once, collecting statistics, language file counts
+        and special files in the same pass
+        
+        Returns:
+            Tuple of (repository stats, primary languages, special files)
+        """
         stats = {
             'total_files': 0,
             'total_size_bytes': 0,
@@ -141,127 +213,81 @@ class SupervisorAgent(BaseAgent):
             'directory_count': 0,
             'max_depth': 0
         }
+        source_extension_counts = {}
+        special_files = {category: [] for category in SPECIAL_FILE_PATTERNS}
+        
+        # Directories below a non-source directory don't count towards languages
+        non_source_dirs = set()
+        # Depth of each directory still to be visited, derived from its parent
+        dir_depths = {}
         
         try:
             for root, dirs, files in os.walk(repo_path):
-                # Calculate depth
-                depth = root.replace(repo_path, '').count(os.sep)
-                stats['max_depth'] = max(stats['max_depth'], depth)
+                depth = dir_depths.pop(root, 0)
+                if depth > stats['max_depth']:
+                    stats['max_depth'] = depth
                 stats['directory_count'] += len(dirs)
                 
+                count_languages = root not in non_source_dirs
+                for dir_name in dirs:
+                    dir_path = os.path.join(root, dir_name)
+                    dir_depths[dir_path] = depth + 1
+                    if not count_languages or dir_name in NON_SOURCE_DIRS:
+                        non_source_dirs.add(dir_path)
+                
                 for file in files:
+                    ext = os.path.splitext(file)[1].lower()
+                    
+                    if count_languages and ext in LANGUAGE_MAPPINGS:
+                        source_extension_counts[ext] = source_extension_counts.get(ext, 0) + 1
+                    
                     if not file.startswith('.'):  # Skip hidden files
                         stats['total_files'] += 1
                         
                         try:
-                            file_path = os.path.join(root, file)
-                            stats['total_size_bytes'] += os.path.getsize(file_path)
+                            stats['total_size_bytes'] += os.path.getsize(os.path.join(root, file))
                             
                             # Track extensions
-                            ext = os.path.splitext(file)[1].lower()
                             if ext:
                                 stats['file_extensions'][ext] = stats['file_extensions'].get(ext, 0) + 1
                         except OSError:
                             continue
+                
+                self._collect_special_files(os.path.relpath(root, repo_path), dirs, files, special_files)
         
         except Exception as e:
-            self.logger.error(f"Error getting repository stats: {e}")
+            self.logger.error(f"Error scanning repository: {e}")
         
-        return stats
+        return stats, self._rank_primary_languages(source_extension_counts), special_files
     
-    def _detect_primary_languages(self, repo_path: str) -> List[str]:
-        """Detect primary programming languages in the repository"""
-        language_mappings = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.jsx': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.tsx': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin'
-        }
-        
-        extension_counts = {}
-        
-        for root, dirs, files in os.walk(repo_path):
-            # Skip common non-source directories
-            dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build']]
-            
-            for file in files:
-                ext = os.path.splitext(file)[1].lower()
-                if ext in language_mappings:
-                    extension_counts[ext] = extension_counts.get(ext, 0) + 1
+    def _rank_primary_languages(self, extension_counts: Dict[str, int]) -> List[str]:
+        """Determine primary programming languages from source file counts per extension"""
+        # Total file count per language, computed once for the sort below
+        language_counts = {}
+        for ext, count in extension_counts.items():
+            language = LANGUAGE_MAPPINGS[ext]
+            language_counts[language] = language_counts.get(language, 0) + count
         
         # Determine primary languages (must have at least 3 files)
-        primary_languages = []
-        for ext, count in extension_counts.items():
-            if count >= 3:
-                primary_languages.append(language_mappings[ext])
+        primary_languages = [
+            LANGUAGE_MAPPINGS[ext] for ext, count in extension_counts.items() if count >= 3
+        ]
         
         # Sort by file count
-        primary_languages.sort(key=lambda lang: sum(
-            count for ext, count in extension_counts.items() 
-            if language_mappings.get(ext) == lang
-        ), reverse=True)
+        primary_languages.sort(key=language_counts.__getitem__, reverse=True)
         
         return primary_languages
     
-    def _detect_special_files(self, repo_path: str) -> Dict[str, List[str]]:
-        """Detect special configuration and project files"""
-        special_files = {
-            'dependency_files': [],
-            'config_files': [],
-            'documentation_files': [],
-            'ci_files': [],
-            'container_files': []
-        }
-        
-        # File patterns to look for
-        patterns = {
-            'dependency_files': [
-                'requirements.txt', 'package.json', 'pom.xml', 'build.gradle', 
-                'Gemfile', 'composer.json', 'go.mod', 'Cargo.toml', 'pyproject.toml'
-            ],
-            'config_files': [
-                '.env', 'config.json', 'settings.json', '.gitignore', 
-                'tsconfig.json', 'webpack.config.js', 'babel.config.js'
-            ],
-            'documentation_files': [
-                'README.md', 'README.rst', 'CHANGELOG.md', 'CONTRIBUTING.md', 
-                'LICENSE', 'docs/', 'documentation/'
-            ],
-            'ci_files': [
-                '.github/', '.gitlab-ci.yml', 'Jenkinsfile', '.travis.yml', 
-                'azure-pipelines.yml', '.circleci/'
-            ],
-            'container_files': [
-                'Dockerfile', 'docker-compose.yml', '.dockerignore', 'kubernetes/'
-            ]
-        }
-        
-        for root, dirs, files in os.walk(repo_path):
-            rel_root = os.path.relpath(root, repo_path)
-            
-            for category, file_patterns in patterns.items():
-                for pattern in file_patterns:
-                    if pattern.endswith('/'):
-                        # Directory pattern
-                        if pattern.rstrip('/') in dirs:
-                            special_files[category].append(os.path.join(rel_root, pattern.rstrip('/')))
-                    else:
-                        # File pattern
-                        if pattern in files:
-                            special_files[category].append(os.path.join(rel_root, pattern))
-        
-        return special_files
+    def _collect_special_files(self, rel_root: str, dirs: List[str], files: List[str],
+                               special_files: Dict[str, List[str]]):
+        """Record special configuration and project files found in one directory"""
+        # One dict lookup per entry instead of scanning the listing per pattern
+        matches = [SPECIAL_FILE_INDEX[name] for name in files if name in SPECIAL_FILE_INDEX]
+        matches.extend(SPECIAL_DIR_INDEX[name] for name in dirs if name in SPECIAL_DIR_INDEX)
+        
+        # Keep the declaration order of SPECIAL_FILE_PATTERNS
+        for _, category, name in sorted(matches):
+            special_files[category].append(os.path.join(rel_root, name))
     
     def _determine_analysis_preferences(self, repo_stats: Dict[str, Any], 
                                       languages: List[str], special_files: Dict[str, List[str]]) -> Dict[str, Any]:
@@ -304,41 +330,41 @@ class SupervisorAgent(BaseAgent):
         # Determine agent execution order based on preferences
         execution_plan = self._create_execution_plan(context.get('analysis_preferences', {}))
         
-        # Execute agents in batches to control concurrency
-        for batch in execution_plan:
-            batch_tasks = []
-            
-            for agent_name in batch:
-                if agent_name in self.agents:
-                    task = self._run_agent_with_retry(agent_name, repo_path, context)
-                    batch_tasks.append((agent_name, task))
-            
-            # Execute batch
-            if batch_tasks:
-                self.logger.info(f"Executing batch: {[name for name, _ in batch_tasks]}")
-                batch_results = await asyncio.gather(
-                    *[task for _, task in batch_tasks],
-                    return_exceptions=True
-                )
-                
-                # Process batch results
-                for (agent_name, _), result in zip(batch_tasks, batch_results):
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Agent {agent_name} failed with exception: {result}")
-                        agent_results[agent_name] = {
-                            'error': str(result),
-                            'agent': agent_name,
-                            'category': self.agents[agent_name].category,
-                            'score': 0,
-                            'issues': [],
-                            'suggestions': [],
-                            'summary': f"Agent failed: {str(result)}"
-                        }
-                    else:
-                        agent_results[agent_name] = result
+        # Agents start in plan order; the semaphore caps how many run at once,
+        # and a slot is handed to the next agent as soon as any agent finishes
+        # instead of waiting for the whole batch
+        agent_names = [name for batch in execution_plan for name in batch if name in self.agents]
+        self.logger.info(f"Executing agents: {agent_names}")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_agents)
+        results = await asyncio.gather(
+            *[self._run_agent_bounded(semaphore, name, repo_path, context) for name in agent_names],
+            return_exceptions=True
+        )
+        
+        for agent_name, result in zip(agent_names, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Agent {agent_name} failed with exception: {result}")
+                agent_results[agent_name] = {
+                    'error': str(result),
+                    'agent': agent_name,
+                    'category': self.agents[agent_name].category,
+                    'score': 0,
+                    'issues': [],
+                    'suggestions': [],
+                    'summary': f"Agent failed: {str(result)}"
+                }
+            else:
+                agent_results[agent_name] = result
         
         return agent_results
     
+    async def _run_agent_bounded(self, semaphore: asyncio.Semaphore, agent_name: str,
+                                 repo_path: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run an agent once a concurrency slot is free"""
+        async with semaphore:
+            return await self._run_agent_with_retry(agent_name, repo_path, context)
+    
     def _create_execution_plan(self, preferences: Dict[str, Any]) -> List[List[str]]:
         """Create agent execution plan based on preferences and dependencies"""
         
@@ -414,14 +440,11 @@ class SupervisorAgent(BaseAgent):
     
     def _validate_agent_result(self, result: Dict[str, Any]) -> bool:
         """Validate that an agent result has the required structure"""
-        required_fields = ['agent', 'category', 'score', 'issues', 'suggestions', 'summary']
-        
         if not isinstance(result, dict):
             return False
         
-        for field in required_fields:
-            if field not in result:
-                return False
+        if not result.keys() >= REQUIRED_RESULT_FIELDS:
+            return False
         
         # Validate field types
         if not isinstance(result['score'], (int, float)) or not (0 <= result['score'] <= 100):
@@ -484,12 +507,14 @@ class SupervisorAgent(BaseAgent):
         agent_results = {}
         tasks = []
         
+        semaphore = asyncio.Semaphore(self.max_concurrent_agents)
         for agent_name, agent in selected_agents.items():
-            task = self._run_agent_with_retry(agent_name, repo_path, analysis_context)
+            task = self._run_agent_bounded(semaphore, agent_name, repo_path, analysis_context)
             tasks.append((agent_name, task))
         
         # Execute all selected agents
-        results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+        with ast_cache_scope():
+            results = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
         
         for (agent_name, _), result in zip(tasks, results):
             if isinstance(result, Exception):
@@ -512,15 +537,9 @@ class SupervisorAgent(BaseAgent):
         """Get status information about all agents"""
         return {
             'supervisor_version': '1.0',
-            'total_agents': len(self.agents),
-            'available_agents': list(self.agents.keys()),
-            'agent_details': {
-                name: {
-                    'name': agent.name,
-                    'category': agent.category
-                }
-                for name, agent in self.agents.items()
-            },
+            'total_agents': len(self._available_agents),
+            'available_agents': list(self._available_agents),
+            'agent_details': {name: dict(details) for name, details in self._agent_details.items()},
             'configuration': {
                 'max_concurrent_agents': self.max_concurrent_agents,
                 'agent_timeout': self.agent_timeout,
@@ -1,14 +1,18 @@
 """
 Trend & Regression Agent - Tracks changes between multiple analysis runs over time
 """
-import json
 import sqlite3
 import os
+import orjson
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from .base_agent import BaseAgent
 
+def _to_json(value: Any) -> str:
+    """Serialize a value for a TEXT column"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
 class TrendAgent(BaseAgent):
     """Agent for tracking trends and regressions across analysis runs"""
     
@@ -147,14 +151,14 @@ class TrendAgent(BaseAgent):
                     git_info.get('branch'),
                     datetime.utcnow().isoformat(),
                     overall_score,
-                    json.dumps(category_scores),
+                    _to_json(category_scores),
                     len(all_issues),
                     issue_counts['critical'],
                     issue_counts['high'],
                     issue_counts['medium'],
                     issue_counts['low'],
-                    json.dumps(analysis_results),
-                    json.dumps(metadata)
+                    _to_json(analysis_results),
+                    _to_json(metadata)
                 ))
         
         except Exception as e:
@@ -208,10 +212,10 @@ class TrendAgent(BaseAgent):
                 historical_data = []
                 for row in rows:
                     data = dict(row)
-                    data['category_scores'] = json.loads(data['category_scores'])
-                    data['agent_results'] = json.loads(data['agent_results'])
+                    data['category_scores'] = orjson.loads(data['category_scores'])
+                    data['agent_results'] = orjson.loads(data['agent_results'])
                     if data['metadata']:
-                        data['metadata'] = json.loads(data['metadata'])
+                        data['metadata'] = orjson.loads(data['metadata'])
                     historical_data.append(data)
                 
                 return historical_data
@@ -239,7 +243,7 @@ class TrendAgent(BaseAgent):
         previous_categories = previous['category_scores']
         
         category_trends = {}
-        for category in set(list(current_categories.keys()) + list(previous_categories.keys())):
+        for category in current_categories.keys() | previous_categories.keys():
             current_score = current_categories.get(category, 0)
             previous_score = previous_categories.get(category, 0)
             category_trends[category] = current_score - previous_score
@@ -592,7 +596,7 @@ class TrendAgent(BaseAgent):
                 
                 # Process the data
                 for run in runs:
-                    run['category_scores'] = json.loads(run['category_scores'])
+                    run['category_scores'] = orjson.loads(run['category_scores'])
                 
                 return {
                     'repo_path': repo_path,
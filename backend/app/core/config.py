@@ -33,6 +33,20 @@ class Settings(BaseSettings):
     
     # Git Settings
     GIT_CLONE_TIMEOUT: int = 300  # 5 minutes
+    # Clone in-process via libgit2; needs `pip install pygit2>=1.14.0` and
+    # ignores the system git config and credentials
+    GIT_USE_LIBGIT2: bool = False
+    GIT_USE_REPO_CACHE: bool = True  # Check out worktrees from cached bare mirrors
+    REPO_CACHE_DIR: str = "/tmp/codeguard/repos"
+    REPO_CACHE_MAX_MIRRORS: int = 20  # Least recently used mirrors beyond this are evicted
+    REPO_CACHE_MAX_AGE_SECONDS: int = 7 * 86400  # Evict mirrors unused for 7 days
+    
+    # Analysis results
+    ISSUE_DESC_MAX_LENGTH: int = 500  # Longer issue descriptions are truncated; 0 keeps them in full
+    
+    # Analysis result cache
+    ANALYSIS_CACHE_TTL_SECONDS: int = 86400  # 24 hours
+    ANALYSIS_CACHE_MAX_SIZE: int = 1000
     
     # Ollama LLM Settings
     OLLAMA_BASE_URL: str = "http://localhost:11434"
@@ -11,6 +11,74 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# System prompts per analysis type, built once at import
+SYSTEM_PROMPTS = {
+    "quality": """You are a code quality expert. Analyze code for:
+- Readability and maintainability
+- Naming consistency and clarity
+- Function/method complexity
+- Code duplication
+- Code smells (long functions, deep nesting, etc.)
+- Refactoring opportunities
+
+Return JSON with: {"category": "Quality", "score": 0-100, "issues": [{"file": "filename", "line": number, "desc": "description", "severity": "low|medium|high"}], "suggestions": ["suggestion1", "suggestion2"]}""",
+    
+    "security": """You are a security expert. Analyze code for:
+- Hardcoded secrets, tokens, passwords
+- SQL injection vulnerabilities
+- XSS vulnerabilities
+- Insecure deserialization
+- Unsafe file operations
+- Authentication/authorization issues
+- Configuration security issues
+
+Return JSON with: {"category": "Security", "score": 0-100, "issues": [{"file": "filename", "line": number, "desc": "description", "severity": "low|medium|high|critical", "cwe": "CWE-XXX"}], "recommendations": ["rec1", "rec2"]}""",
+    
+    "architecture": """You are a software architecture expert. Analyze code for:
+- Module structure and organization
+- Separation of concerns
+- Design patterns usage
+- Coupling and cohesion
+- Circular dependencies
+- SOLID principles adherence
+- Code organization best practices
+
+Return JSON with: {"category": "Architecture", "score": 0-100, "summary": "brief summary", "issues": [{"desc": "description", "severity": "low|medium|high"}], "suggestions": ["suggestion1", "suggestion2"]}""",
+    
+    "documentation": """You are a documentation expert. Analyze code for:
+- Docstring coverage and quality
+- Inline comment clarity
+- README completeness
+- Code self-documentation
+- API documentation
+- Missing explanations for complex logic
+
+Return JSON with: {"category": "Documentation", "score": 0-100, "missing_docs": ["file1", "file2"], "issues": [{"file": "filename", "desc": "description"}], "suggestions": ["suggestion1", "suggestion2"]}""",
+    
+    "testing": """You are a testing expert. Analyze code for:
+- Test coverage assessment
+- Test structure and organization
+- Test naming conventions
+- Edge case coverage
+- Mock usage
+- Integration vs unit tests
+- Test maintainability
+
+Return JSON with: {"category": "Testing", "score": 0-100, "summary": "brief summary", "issues": [{"desc": "description", "severity": "low|medium|high"}], "suggestions": ["suggestion1", "suggestion2"]}""",
+    
+    "dependencies": """You are a dependency management expert. Analyze for:
+- Outdated packages
+- Security vulnerabilities in dependencies
+- License compatibility issues
+- Unused dependencies
+- Dependency bloat
+- Version pinning best practices
+
+Return JSON with: {"category": "Dependencies", "score": 0-100, "issues": [{"package": "package_name", "version": "version", "desc": "description", "severity": "low|medium|high|critical"}], "suggestions": ["suggestion1", "suggestion2"]}"""
+}
+
+DEFAULT_SYSTEM_PROMPT = "You are a code analysis expert. Analyze the provided code and return your findings in JSON format."
+
 class OllamaLLMProvider:
     """LLM Provider for Ollama with Qwen3:8b model"""
     
@@ -18,22 +86,41 @@ class OllamaLLMProvider:
         self.base_url = (base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")).rstrip('/')
         self.model = model or os.getenv("OLLAMA_MODEL", "qwen3:8b")
         self.timeout = 300  # 5 minutes timeout for analysis
+        # Shared keep-alive connection pool, created on first use in the running loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the current event loop"""
+        loop = asyncio.get_running_loop()
+        # Connections are bound to the loop that opened them
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
         
     async def _make_request(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make async HTTP request to Ollama API"""
         url = f"{self.base_url}{endpoint}"
+        client = self._get_client()
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(url, json=data)
-                response.raise_for_status()
-                return response.json()
-            except httpx.RequestError as e:
-                logger.error(f"Request error to Ollama: {e}")
-                raise Exception(f"Failed to connect to Ollama: {e}")
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error from Ollama: {e}")
-                raise Exception(f"Ollama API error: {e}")
+        try:
+            response = await client.post(url, json=data)
+            response.raise_for_status()
+            return response.json()
+        except httpx.RequestError as e:
+            logger.error(f"Request error to Ollama: {e}")
+            raise Exception(f"Failed to connect to Ollama: {e}")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error from Ollama: {e}")
+            raise Exception(f"Ollama API error: {e}")
     
     async def generate_completion(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate completion using Ollama"""
@@ -88,72 +175,7 @@ Provide your analysis in valid JSON format only, no additional text or explanati
     
     def _get_system_prompt(self, analysis_type: str) -> str:
         """Get system prompt based on analysis type"""
-        prompts = {
-            "quality": """You are a code quality expert. Analyze code for:
-- Readability and maintainability
-- Naming consistency and clarity
-- Function/method complexity
-- Code duplication
-- Code smells (long functions, deep nesting, etc.)
-- Refactoring opportunities
-
-Return JSON with: {"category": "Quality", "score": 0-100, "issues": [{"file": "filename", "line": number, "desc": "description", "severity": "low|medium|high"}], "suggestions": ["suggestion1", "suggestion2"]}""",
-            
-            "security": """You are a security expert. Analyze code for:
-- Hardcoded secrets, tokens, passwords
-- SQL injection vulnerabilities
-- XSS vulnerabilities
-- Insecure deserialization
-- Unsafe file operations
-- Authentication/authorization issues
-- Configuration security issues
-
-Return JSON with: {"category": "Security", "score": 0-100, "issues": [{"file": "filename", "line": number, "desc": "description", "severity": "low|medium|high|critical", "cwe": "CWE-XXX"}], "recommendations": ["rec1", "rec2"]}""",
-            
-            "architecture": """You are a software architecture expert. Analyze code for:
-- Module structure and organization
-- Separation of concerns
-- Design patterns usage
-- Coupling and cohesion
-- Circular dependencies
-- SOLID principles adherence
-- Code organization best practices
-
-Return JSON with: {"category": "Architecture", "score": 0-100, "summary": "brief summary", "issues": [{"desc": "description", "severity": "low|medium|high"}], "suggestions": ["suggestion1", "suggestion2"]}""",
-            
-            "documentation": """You are a documentation expert. Analyze code for:
-- Docstring coverage and quality
-- Inline comment clarity
-- README completeness
-- Code self-documentation
-- API documentation
-- Missing explanations for complex logic
-
-Return JSON with: {"category": "Documentation", "score": 0-100, "missing_docs": ["file1", "file2"], "issues": [{"file": "filename", "desc": "description"}], "suggestions": ["suggestion1", "suggestion2"]}""",
-            
-            "testing": """You are a testing expert. Analyze code for:
-- Test coverage assessment
-- Test structure and organization
-- Test naming conventions
-- Edge case coverage
-- Mock usage
-- Integration vs unit tests
-- Test maintainability
-
-Return JSON with: {"category": "Testing", "score": 0-100, "summary": "brief summary", "issues": [{"desc": "description", "severity": "low|medium|high"}], "suggestions": ["suggestion1", "suggestion2"]}""",
-            
-            "dependencies": """You are a dependency management expert. Analyze for:
-- Outdated packages
-- Security vulnerabilities in dependencies
-- License compatibility issues
-- Unused dependencies
-- Dependency bloat
-- Version pinning best practices
-
-Return JSON with: {"category": "Dependencies", "score": 0-100, "issues": [{"package": "package_name", "version": "version", "desc": "description", "severity": "low|medium|high|critical"}], "suggestions": ["suggestion1", "suggestion2"]}"""
-        }
-        
-        return prompts.get(analysis_type, "You are a code analysis expert. Analyze the provided code and return your findings in JSON format.")
+        return SYSTEM_PROMPTS.get(analysis_type, DEFAULT_SYSTEM_PROMPT)
     
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
         """Parse JSON response from LLM, handling potential formatting issues"""
@@ -218,19 +240,18 @@ Return JSON with: {"category": "Dependencies", "score": 0-100, "issues": [{"pack
         """Check if Ollama service is healthy and model is available"""
         try:
             # Check if Ollama is running
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                
-                # Check if our model is available
-                models = response.json().get("models", [])
-                model_names = [model.get("name", "") for model in models]
-                
-                if self.model not in model_names:
-                    logger.warning(f"Model {self.model} not found. Available models: {model_names}")
-                    return False
-                
-                return True
+            response = await self._get_client().get(f"{self.base_url}/api/tags", timeout=10)
+            response.raise_for_status()
+            
+            # Check if our model is available
+            models = response.json().get("models", [])
+            model_names = [model.get("name", "") for model in models]
+            
+            if self.model not in model_names:
+                logger.warning(f"Model {self.model} not found. Available models: {model_names}")
+                return False
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.routers import projects, github, auth, analysis
 from app.core.database import engine
+from app.core.llm_provider import llm_provider
 from app.models.database import Base
 
 # Create database tables
@@ -35,6 +36,10 @@ app.include_router(analysis.router, prefix=f"{settings.API_V1_STR}/analysis", ta
 # Add plural form for compatibility with frontend
 app.include_router(analysis.router, prefix=f"{settings.API_V1_STR}/analyses", tags=["analyses"])
 
+@app.on_event("shutdown")
+async def close_llm_client():
+    await llm_provider.aclose()
+
 @app.get("/")
 async def root():
     return {"message": "CodeGuard API is running!"}
@@ -2,13 +2,17 @@
 Analysis Router - FastAPI endpoints for the LLM-powered static analysis platform
 """
 import os
+import asyncio
 import tempfile
 import shutil
 from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Path, Depends
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from git import Repo
+from app.services.github_service import clone_from, head_commit, resolve_remote_commit
+from app.services.analysis_cache import analysis_cache
+from app.services.repository_cache import repository_cache
+from app.core.config import settings
 from app.services.results_aggregator import results_aggregator
 from app.core.database import get_db
 from app.routers.auth import get_current_user_dependency
@@ -209,17 +213,25 @@ async def start_analysis(
 ):
     """Start a new repository analysis"""
     try:
+        # Return previous results if this commit was already analyzed
+        cache_key = await _get_cache_key(request)
+        cached_id = await _get_cached_result_id(cache_key)
+        if cached_id:
+            return AnalysisResponse(
+                success=True,
+                result_id=cached_id,
+                message="Returned cached analysis results"
+            )
+        
         # Clone repository to temporary directory
-        temp_dir = tempfile.mkdtemp(prefix="codeguard_analysis_")
+        temp_dir = await asyncio.to_thread(tempfile.mkdtemp, prefix="codeguard_analysis_")
         
         try:
-            # Clone the repository
-            repo = Repo.clone_from(
-                request.repo_url,
-                temp_dir,
-                branch=request.branch,
-                depth=1  # Shallow clone for faster analysis
-            )
+            # Check out the repository off the event loop; results are cached
+            # under the commit actually analyzed, which may be newer than the
+            # one looked up above
+            commit_sha = await _checkout_repository(request, temp_dir)
+            cache_key = _make_cache_key(request, commit_sha)
             
             # Run analysis in background
             if request.agents:
@@ -228,7 +240,8 @@ async def start_analysis(
                     _run_selective_analysis,
                     temp_dir,
                     request.agents,
-                    request.context
+                    request.context,
+                    cache_key
                 )
                 message = f"Started selective analysis with {len(request.agents)} agents"
             else:
@@ -236,7 +249,8 @@ async def start_analysis(
                 background_tasks.add_task(
                     _run_full_analysis,
                     temp_dir,
-                    request.context
+                    request.context,
+                    cache_key
                 )
                 message = "Started full analysis with all agents"
             
@@ -247,8 +261,7 @@ async def start_analysis(
         
         except Exception as e:
             # Cleanup on error
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            await _remove_dir(temp_dir)
             raise e
     
     except Exception as e:
@@ -263,16 +276,22 @@ async def analyze_sync(request: AnalysisRequest):
     """Run analysis synchronously and return results immediately"""
     temp_dir = None
     try:
+        # Return previous results if this commit was already analyzed
+        cache_key = await _get_cache_key(request)
+        cached_id = await _get_cached_result_id(cache_key)
+        if cached_id:
+            cached = await asyncio.to_thread(results_aggregator.get_results, cached_id)
+            if cached:
+                return cached
+            analysis_cache.discard(cache_key)
+        
         # Clone repository to temporary directory
-        temp_dir = tempfile.mkdtemp(prefix="codeguard_analysis_")
+        temp_dir = await asyncio.to_thread(tempfile.mkdtemp, prefix="codeguard_analysis_")
         
-        # Clone the repository
-        repo = Repo.clone_from(
-            request.repo_url,
-            temp_dir,
-            branch=request.branch,
-            depth=1
-        )
+        # Check out the repository off the event loop; results are cached
+        # under the commit actually analyzed
+        commit_sha = await _checkout_repository(request, temp_dir)
+        cache_key = _make_cache_key(request, commit_sha)
         
         # Run analysis
         if request.agents:
@@ -284,6 +303,8 @@ async def analyze_sync(request: AnalysisRequest):
                 temp_dir, request.context
             )
         
+        _cache_result(cache_key, results)
+        
         return results
     
     except Exception as e:
@@ -294,8 +315,8 @@ async def analyze_sync(request: AnalysisRequest):
     
     finally:
         # Cleanup temporary directory
-        if temp_dir and os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        if temp_dir:
+            await _remove_dir(temp_dir)
 
 @router.get("/results/{result_id}", response_model=Dict[str, Any])
 async def get_analysis_results(result_id: str = Path(..., description="Analysis result ID")):
@@ -316,13 +337,14 @@ async def list_analysis_results(
     limit: int = Query(50, ge=1, le=200, description="Maximum number of results to return")
 ):
     """List stored analysis results"""
-    results = results_aggregator.list_results(repo_path, limit)
+    results = await asyncio.to_thread(results_aggregator.list_results, repo_path, limit)
     return results
 
 @router.delete("/results/{result_id}")
 async def delete_analysis_results(result_id: str = Path(..., description="Analysis result ID")):
     """Delete analysis results by ID"""
     success = results_aggregator.delete_results(result_id)
+    analysis_cache.discard_result(result_id)
     
     if not success:
         raise HTTPException(
@@ -377,7 +399,7 @@ async def cleanup_old_results(
 ):
     """Clean up old analysis results and trend data"""
     try:
-        results_aggregator.cleanup_old_results(days_to_keep)
+        await results_aggregator.cleanup_old_results(days_to_keep)
         return {"message": f"Cleanup completed, kept results from last {days_to_keep} days"}
     except Exception as e:
         raise HTTPException(
@@ -386,24 +408,95 @@ async def cleanup_old_results(
         )
 
 # Background task functions
-async def _run_full_analysis(repo_path: str, context: Optional[Dict] = None):
+async def _checkout_repository(request: AnalysisRequest, temp_dir: str) -> Optional[str]:
+    """
+    Check out the repository into temp_dir, preferring a worktree of the cached mirror
+    
+    Returns:
+        SHA of the checked-out commit, or None if it could not be determined
+    """
+    if settings.GIT_USE_REPO_CACHE:
+        try:
+            return await asyncio.to_thread(
+                repository_cache.checkout, request.repo_url, temp_dir, request.branch
+            )
+        except Exception as e:
+            print(f"Repository cache checkout failed, falling back to clone: {e}")
+            await asyncio.to_thread(_empty_dir, temp_dir)
+    
+    repo = await asyncio.to_thread(
+        clone_from,
+        request.repo_url,
+        temp_dir,
+        branch=request.branch,
+        depth=1  # Shallow clone for faster analysis
+    )
+    return head_commit(repo)
+
+def _empty_dir(path: str):
+    """Remove everything inside a directory, keeping the directory itself"""
+    for entry in os.scandir(path):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            os.remove(entry.path)
+
+async def _get_cache_key(request: AnalysisRequest) -> Optional[str]:
+    """Build the cache key for the current remote commit, or None if it can't be cached"""
+    if request.context:
+        return None
+    
+    commit_sha = await asyncio.to_thread(resolve_remote_commit, request.repo_url, request.branch)
+    return _make_cache_key(request, commit_sha)
+
+def _make_cache_key(request: AnalysisRequest, commit_sha: Optional[str]) -> Optional[str]:
+    """Build the result cache key for a request at a commit, or None if it can't be cached"""
+    if request.context or not commit_sha:
+        return None
+    
+    return analysis_cache.make_key(request.repo_url, commit_sha, request.agents)
+
+async def _get_cached_result_id(cache_key: Optional[str]) -> Optional[str]:
+    """Look up the stored result for a cache key, dropping entries whose result was deleted"""
+    if not cache_key:
+        return None
+    
+    result_id = analysis_cache.get(cache_key)
+    if result_id and not await asyncio.to_thread(results_aggregator.has_results, result_id):
+        analysis_cache.discard(cache_key)
+        return None
+    
+    return result_id
+
+def _cache_result(cache_key: Optional[str], results: Dict[str, Any]):
+    """Remember the stored result of a successful analysis"""
+    if cache_key and results.get('success') and results.get('result_id'):
+        analysis_cache.set(cache_key, results['result_id'])
+
+async def _remove_dir(path: str):
+    """Remove a cloned repository without blocking the event loop"""
+    repository_cache.discard(path)
+
+async def _run_full_analysis(repo_path: str, context: Optional[Dict] = None,
+                             cache_key: Optional[str] = None):
     """Background task for full analysis"""
     try:
-        await results_aggregator.run_full_analysis(repo_path, context)
+        results = await results_aggregator.run_full_analysis(repo_path, context)
+        _cache_result(cache_key, results)
     except Exception as e:
         print(f"Background analysis failed: {e}")
     finally:
         # Cleanup temporary directory
-        if os.path.exists(repo_path):
-            shutil.rmtree(repo_path, ignore_errors=True)
+        await _remove_dir(repo_path)
 
-async def _run_selective_analysis(repo_path: str, agent_names: List[str], context: Optional[Dict] = None):
+async def _run_selective_analysis(repo_path: str, agent_names: List[str], context: Optional[Dict] = None,
+                                  cache_key: Optional[str] = None):
     """Background task for selective analysis"""
     try:
-        await results_aggregator.run_selective_analysis(repo_path, agent_names, context)
+        results = await results_aggregator.run_selective_analysis(repo_path, agent_names, context)
+        _cache_result(cache_key, results)
     except Exception as e:
         print(f"Background selective analysis failed: {e}")
     finally:
         # Cleanup temporary directory
-        if os.path.exists(repo_path):
-            shutil.rmtree(repo_path, ignore_errors=True)
+        await _remove_dir(repo_path)
@@ -0,0 +1,63 @@
+"""
+Analysis Result Cache - In-memory TTL/LRU cache mapping analysed repository
+snapshots to the IDs of their stored results
+"""
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from app.core.config import settings
+
+class AnalysisResultCache:
+    """LRU cache of stored result IDs keyed by repository, commit and agent selection"""
+
+    def __init__(self, ttl_seconds: int = None, max_size: int = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.ANALYSIS_CACHE_TTL_SECONDS
+        self.max_size = max_size if max_size is not None else settings.ANALYSIS_CACHE_MAX_SIZE
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(repo_url: str, commit_sha: str, agents: Optional[List[str]] = None) -> str:
+        """Build a cache key for a repository snapshot and agent selection"""
+        agent_key = ','.join(sorted(agents)) if agents else '*'
+        return f"{repo_url.rstrip('/')}@{commit_sha}:{agent_key}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached result ID, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        result_id, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return result_id
+
+    def set(self, key: str, result_id: str):
+        """Store a result ID, evicting the least recently used entries when full"""
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (result_id, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str):
+        """Drop the entry for a key, if any"""
+        self._entries.pop(key, None)
+
+    def discard_result(self, result_id: str):
+        """Drop every entry pointing at a result that no longer exists"""
+        for key in [key for key, (cached_id, _) in self._entries.items() if cached_id == result_id]:
+            del self._entries[key]
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+
+# Global instance
+analysis_cache = AnalysisResultCache()
@@ -1,4 +1,3 @@
-from github import Github
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from app.core.config import settings
@@ -6,11 +5,103 @@ import logging
 import git
 import os
 import time
+import threading
+import requests
+from collections import OrderedDict
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+ETAG_CACHE_MAX_ENTRIES = 1024
+
+# Shared across GitHubService instances (one is created per request, on
+# FastAPI's threadpool). Maps (access_token, url) -> (etag, json body,
+# pagination links), least recently used first.
+_etag_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_etag_cache_lock = threading.Lock()
+_http = requests.Session()
+
+
+def _isoformat(timestamp: Optional[str]) -> Optional[str]:
+    """Convert a GitHub timestamp ('...Z') to isoformat ('...+00:00')"""
+    if not timestamp:
+        return None
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).isoformat()
+
+
+def clone_from(
+    clone_url: str,
+    target_path: str,
+    branch: Optional[str] = None,
+    depth: Optional[int] = None,
+):
+    """
+    Clone a repository in-process with libgit2 when available, otherwise
+    fall back to GitPython (which shells out to the git binary)
+
+    Returns:
+        pygit2.Repository or git.Repo depending on the backend used
+    """
+    if settings.GIT_USE_LIBGIT2 and pygit2 is not None:
+        return pygit2.clone_repository(
+            clone_url,
+            target_path,
+            checkout_branch=branch,
+            depth=depth or 0,
+        )
+
+    kwargs = {"single_branch": True}
+    if branch:
+        kwargs["branch"] = branch
+    if depth:
+        kwargs["depth"] = depth
+    else:
+        # Full history without old blobs; a shallow checkout needs all of its
+        # commit's blobs anyway, so it gains nothing from the filter
+        kwargs["filter"] = "blob:none"
+    return git.Repo.clone_from(clone_url, target_path, **kwargs)
+
+
+def resolve_remote_commit(clone_url: str, branch: Optional[str] = None) -> Optional[str]:
+    """Resolve the commit a branch points at without cloning (git ls-remote)"""
+    ref = f"refs/heads/{branch}" if branch else "HEAD"
+    try:
+        output = git.cmd.Git().ls_remote(clone_url, ref)
+    except Exception as e:
+        logger.warning(f"Could not resolve {ref} for {clone_url}: {str(e)}")
+        return None
+
+    line = output.partition("\n")[0]
+    return line.partition("\t")[0] or None
+
+
+def head_commit(repo) -> Optional[str]:
+    """SHA of the checked-out commit for either clone backend"""
+    try:
+        if pygit2 is not None and isinstance(repo, pygit2.Repository):
+            return str(repo.head.target)
+        return repo.head.commit.hexsha
+    except Exception:
+        return None
+
+
+def _count_commits(repo) -> Optional[int]:
+    """Count reachable commits for either clone backend"""
+    try:
+        if pygit2 is not None and isinstance(repo, pygit2.Repository):
+            return sum(1 for _ in repo.walk(repo.head.target))
+        return sum(1 for _ in repo.iter_commits())
+    except Exception:
+        return None
+
 
 @dataclass
 class CloneResult:
@@ -26,20 +117,60 @@ class CloneResult:
 class GitHubService:
     def __init__(self, access_token: str, db: Session = None):
         self.db = db
-        self.github = Github(access_token)
         self.access_token = access_token
     
+    def _conditional_get(self, url: str, params: Optional[Dict[str, Any]] = None):
+        """
+        GET a GitHub API URL, revalidating cached responses with If-None-Match.
+        
+        GitHub answers unchanged resources with 304 Not Modified, which does
+        not count against the rate limit.
+        
+        Returns:
+            Tuple of (json body, pagination links)
+        """
+        request = requests.Request("GET", url, params=params).prepare()
+        cache_key = (self.access_token, request.url)
+        with _etag_cache_lock:
+            cached = _etag_cache.get(cache_key)
+            if cached:
+                _etag_cache.move_to_end(cache_key)
+        
+        headers = {
+            "Authorization": f"token {self.access_token}",
+            "Accept": "application/vnd.github+json",
+        }
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        
+        response = _http.get(request.url, headers=headers, timeout=30)
+        
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2]
+        
+        response.raise_for_status()
+        data = response.json()
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            with _etag_cache_lock:
+                _etag_cache[cache_key] = (etag, data, response.links)
+                if len(_etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                    _etag_cache.popitem(last=False)
+        
+        return data, response.links
+    
     def get_repo_details(self, full_name: str) -> Dict[str, Any]:
         """Get repository details from GitHub by full name."""
         try:
-            repo = self.github.get_repo(full_name)
+            repo, _ = self._conditional_get(f"{GITHUB_API_URL}/repos/{full_name}")
             return {
-                "id": repo.id,
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "private": repo.private,
-                "clone_url": repo.clone_url,
-                "html_url": repo.html_url,
+                "id": repo["id"],
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "private": repo["private"],
+                "clone_url": repo["clone_url"],
+                "html_url": repo["html_url"],
             }
         except Exception as e:
             logger.error(f"Error fetching repo details for {full_name}: {str(e)}")
@@ -48,28 +179,34 @@ class GitHubService:
     def get_user_repositories(self, user_id: str, db: Session = None) -> List[Dict[str, Any]]:
         """Fetch user repositories from GitHub and return as a list of dicts"""
         try:
-            github_user = self.github.get_user()
-            repos = github_user.get_repos(sort="updated", direction="desc")
-            
             repositories = []
+            url = f"{GITHUB_API_URL}/user/repos"
+            params = {"sort": "updated", "direction": "desc", "per_page": 100}
             
-            for repo in repos:
-                repositories.append({
-                    "id": repo.id,
-                    "name": repo.name,
-                    "full_name": repo.full_name,
-                    "description": repo.description,
-                    "private": repo.private,
-                    "html_url": repo.html_url,
-                    "clone_url": repo.clone_url,
-                    "language": repo.language,
-                    "stargazers_count": repo.stargazers_count,
-                    "forks_count": repo.forks_count,
-                    "owner_login": repo.owner.login,
-                    "owner_avatar_url": repo.owner.avatar_url,
-                    "created_at": repo.created_at.isoformat() if repo.created_at else None,
-                    "updated_at": repo.updated_at.isoformat() if repo.updated_at else None,
-                })
+            while url:
+                repos, links = self._conditional_get(url, params)
+                
+                for repo in repos:
+                    repositories.append({
+                        "id": repo["id"],
+                        "name": repo["name"],
+                        "full_name": repo["full_name"],
+                        "description": repo.get("description"),
+                        "private": repo["private"],
+                        "html_url": repo["html_url"],
+                        "clone_url": repo["clone_url"],
+                        "language": repo.get("language"),
+                        "stargazers_count": repo.get("stargazers_count", 0),
+                        "forks_count": repo.get("forks_count", 0),
+                        "owner_login": repo["owner"]["login"],
+                        "owner_avatar_url": repo["owner"].get("avatar_url"),
+                        "created_at": _isoformat(repo.get("created_at")),
+                        "updated_at": _isoformat(repo.get("updated_at")),
+                    })
+                
+                # The "next" link already carries the query parameters
+                url = links.get("next", {}).get("url")
+                params = None
             
             return repositories
             
@@ -80,8 +217,7 @@ class GitHubService:
     def validate_repository_access_by_name(self, full_name: str) -> bool:
         """Validate that user has access to the repository by its full name."""
         try:
-            repo = self.github.get_repo(full_name)
-            _ = repo.name  # Accessing an attribute to trigger potential exception
+            self._conditional_get(f"{GITHUB_API_URL}/repos/{full_name}")
             return True
         except Exception:
             return False
@@ -89,13 +225,13 @@ class GitHubService:
     def get_user(self) -> Optional[dict]:
         """Get GitHub user information"""
         try:
-            user = self.github.get_user()
+            user, _ = self._conditional_get(f"{GITHUB_API_URL}/user")
             return {
-                "id": user.id,
-                "login": user.login,
-                "name": user.name,
-                "email": user.email,
-                "avatar_url": user.avatar_url
+                "id": user["id"],
+                "login": user["login"],
+                "name": user.get("name"),
+                "email": user.get("email"),
+                "avatar_url": user.get("avatar_url")
             }
         except Exception as e:
             logger.error(f"Error fetching user info: {str(e)}")
@@ -143,19 +279,13 @@ class GitHubService:
             os.makedirs(target_path, exist_ok=True)
             
             # Clone the repository
-            if shallow and depth:
-                repo = git.Repo.clone_from(clone_url, target_path, depth=depth)
-            else:
-                repo = git.Repo.clone_from(clone_url, target_path)
+            repo = clone_from(clone_url, target_path, depth=depth if shallow else None)
             
             # Get repository size
             size_mb = self._get_directory_size_mb(target_path)
             
             # Get commit count
-            try:
-                commit_count = len(list(repo.iter_commits()))
-            except:
-                commit_count = None
+            commit_count = _count_commits(repo)
             
             duration = time.time() - start_time
             
@@ -194,11 +324,20 @@ class GitHubService:
     def _get_directory_size_mb(self, path: str) -> float:
         """Calculate directory size in MB"""
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except OSError:
-                    pass
+        pending = [path]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            # DirEntry caches the lstat result, one syscall per file
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
         return total_size / (1024 * 1024)
@@ -0,0 +1,170 @@
+"""
+Repository Cache Service - Keeps one bare mirror per repository and checks out
+analysis working trees from it with `git worktree`
+"""
+import os
+import queue
+import shutil
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Optional
+import git
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class RepositoryCache:
+    """Bare-mirror cache shared by all analyses of the same repository"""
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir or settings.REPO_CACHE_DIR
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # Live worktree path -> mirror it was checked out from
+        self._checkouts: Dict[str, str] = {}
+        self._trash: "queue.Queue[str]" = queue.Queue()
+        self._gc_thread: Optional[threading.Thread] = None
+
+    def _bare_path(self, repo_url: str) -> str:
+        """Path of the bare mirror for a repository URL"""
+        key = hashlib.blake2b(repo_url.rstrip('/').encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.git")
+
+    def _lock_for(self, bare_path: str) -> threading.Lock:
+        """Per-mirror lock so concurrent analyses don't fetch into the same repo"""
+        with self._locks_guard:
+            return self._locks.setdefault(bare_path, threading.Lock())
+
+    def _update_mirror(self, repo_url: str, bare_path: str, branch: Optional[str]):
+        """
+        Create the bare mirror if needed and shallow-fetch the tip of the branch
+
+        Returns:
+            Git command wrapper for the mirror, with the tip in FETCH_HEAD
+        """
+        if not os.path.isdir(bare_path):
+            logger.info(f"Creating bare mirror for {repo_url}")
+            os.makedirs(self.cache_dir, exist_ok=True)
+            try:
+                git.Git().init('--bare', bare_path)
+                git.Git(bare_path).remote('add', 'origin', repo_url)
+            except git.GitCommandError:
+                # A mirror without its remote would fail every later checkout
+                shutil.rmtree(bare_path, ignore_errors=True)
+                raise
+
+        bare = git.Git(bare_path)
+        bare.fetch('--depth=1', 'origin', f"refs/heads/{branch}" if branch else 'HEAD')
+        return bare
+
+    def checkout(self, repo_url: str, target_path: str, branch: Optional[str] = None) -> str:
+        """
+        Check out the tip of a branch into target_path as a detached worktree
+
+        Args:
+            repo_url: Repository clone URL
+            target_path: Empty directory for the working tree
+            branch: Branch to check out (default branch if None)
+
+        Returns:
+            Commit SHA that was checked out
+        """
+        bare_path = self._bare_path(repo_url)
+
+        with self._lock_for(bare_path):
+            bare = self._update_mirror(repo_url, bare_path, branch)
+
+            # Drop metadata of worktrees whose directories were already removed
+            bare.worktree('prune')
+
+            commit = bare.rev_parse('FETCH_HEAD')
+            bare.worktree('add', '--detach', target_path, commit)
+
+            # The directory mtime marks when the mirror was last used
+            os.utime(bare_path)
+            with self._locks_guard:
+                self._checkouts[target_path] = bare_path
+
+        self._evict_mirrors()
+        return commit
+
+    def _evict_mirrors(self):
+        """
+        Drop mirrors unused for longer than the max age, then the least
+        recently used ones beyond the max count
+
+        Mirrors with a live checkout, or a checkout in progress, are kept.
+        """
+        try:
+            mirrors = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith('.git') and entry.is_dir()
+            ]
+        except OSError:
+            return
+
+        mirrors.sort(reverse=True)
+        oldest_allowed = time.time() - settings.REPO_CACHE_MAX_AGE_SECONDS
+        expired = [
+            path for i, (mtime, path) in enumerate(mirrors)
+            if i >= settings.REPO_CACHE_MAX_MIRRORS or mtime < oldest_allowed
+        ]
+
+        for bare_path in expired:
+            lock = self._lock_for(bare_path)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                with self._locks_guard:
+                    in_use = bare_path in self._checkouts.values()
+                if not in_use:
+                    logger.info(f"Evicting bare mirror {bare_path}")
+                    self.discard(bare_path)
+            finally:
+                lock.release()
+
+    def discard(self, path: str):
+        """
+        Remove a checkout without waiting for the delete
+
+        The directory is renamed out of the way (a single syscall) and the
+        actual rmtree happens on a background thread.
+        """
+        with self._locks_guard:
+            self._checkouts.pop(path, None)
+
+        if not os.path.exists(path):
+            return
+
+        trash_path = f"{path}.trash.{os.urandom(4).hex()}"
+        try:
+            os.rename(path, trash_path)
+        except OSError:
+            trash_path = path
+
+        self._ensure_gc_thread()
+        self._trash.put(trash_path)
+
+    def _ensure_gc_thread(self):
+        """Start the background deletion thread on first use"""
+        with self._locks_guard:
+            if self._gc_thread is None or not self._gc_thread.is_alive():
+                self._gc_thread = threading.Thread(
+                    target=self._gc_worker, name="repo-cache-gc", daemon=True
+                )
+                self._gc_thread.start()
+
+    def _gc_worker(self):
+        """Drain the trash queue, deleting directories one at a time"""
+        while True:
+            path = self._trash.get()
+            try:
+                shutil.rmtree(path, ignore_errors=True)
+            finally:
+                self._trash.task_done()
+
+# Global instance
+repository_cache = RepositoryCache()
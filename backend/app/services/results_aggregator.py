@@ -1,9 +1,14 @@
 """
 Results Aggregator Service - Handles aggregation and storage of analysis results
 """
-import json
 import os
+import gzip
+import time
 import asyncio
+import sqlite3
+import threading
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +16,15 @@ from app.core.llm_provider import llm_provider
 from app.agents.supervisor_agent import SupervisorAgent
 from app.agents.trend_agent import TrendAgent
 
+# Compact output: one allocation, one write; the API re-serialises for clients
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+RESULT_SUFFIX = '.json.gz'
+LEGACY_RESULT_SUFFIX = '.json'
+# Fastest gzip level: most of the size win on repetitive JSON at little CPU cost
+COMPRESS_LEVEL = 1
+REINDEX_READ_WORKERS = 32
+CLEANUP_CONCURRENCY = 16
+
 class ResultsAggregator:
     """Service for aggregating and managing analysis results"""
     
@@ -21,6 +35,116 @@ class ResultsAggregator:
         
         # Ensure results directory exists
         os.makedirs(self.results_dir, exist_ok=True)
+        
+        # Index of stored results so listings don't touch the result files;
+        # created on first use, since building it may read every result
+        self.index_path = os.path.join(self.results_dir, 'index.db')
+        self._index_ready = False
+        self._index_lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the results index, creating it on first use"""
+        if not self._index_ready:
+            with self._index_lock:
+                # Left unset on failure, so the next access retries
+                if not self._index_ready:
+                    self._index_ready = self._init_index()
+        return sqlite3.connect(self.index_path)
+    
+    def _init_index(self) -> bool:
+        """Create the results index, rebuilding it from disk if it is new"""
+        try:
+            with sqlite3.connect(self.index_path) as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS results (
+                        result_id TEXT PRIMARY KEY,
+                        repo_path TEXT,
+                        overall_score REAL,
+                        timestamp TEXT,
+                        stored_at TEXT,
+                        success INTEGER NOT NULL,
+                        agents_executed TEXT NOT NULL,
+                        total_issues INTEGER NOT NULL,
+                        mtime REAL NOT NULL
+                    )
+                ''')
+                conn.execute('''CREATE INDEX IF NOT EXISTS idx_results_repo ON results(repo_path, timestamp DESC)''')
+                conn.execute('''CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results(timestamp DESC)''')
+                conn.execute('''CREATE INDEX IF NOT EXISTS idx_results_mtime ON results(mtime)''')
+                
+                is_empty = conn.execute('SELECT 1 FROM results LIMIT 1').fetchone() is None
+            
+            if is_empty:
+                self.reindex()
+            
+            return True
+        
+        except Exception as e:
+            print(f"Error initializing results index: {e}")
+            return False
+    
+    def _index_row(self, data: Dict[str, Any], mtime: float) -> tuple:
+        """Build an index row from a stored result"""
+        summary = self._build_summary(data)
+        return (
+            summary['result_id'],
+            summary['repo_path'],
+            summary['overall_score'],
+            summary['timestamp'],
+            summary['stored_at'],
+            1 if summary['success'] else 0,
+            orjson.dumps(summary['agents_executed'], default=str).decode(),
+            summary['total_issues'],
+            mtime
+        )
+    
+    def _result_files(self, result_id: str) -> List[str]:
+        """Possible on-disk paths for a result, current format first"""
+        return [
+            os.path.join(self.results_dir, f"{result_id}{RESULT_SUFFIX}"),
+            os.path.join(self.results_dir, f"{result_id}{LEGACY_RESULT_SUFFIX}"),
+        ]
+    
+    def _read_result_file(self, filepath: str) -> Dict[str, Any]:
+        """Read a gzip-compressed or legacy plain JSON result file"""
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        if filepath.endswith(RESULT_SUFFIX):
+            data = gzip.decompress(data)
+        return orjson.loads(data)
+    
+    def _load_index_row(self, filepath: str) -> Optional[tuple]:
+        """Read a result file and build its index row"""
+        try:
+            mtime = os.stat(filepath).st_mtime
+            data = self._read_result_file(filepath)
+            if not data.get('result_id'):
+                name = os.path.basename(filepath)
+                suffix = RESULT_SUFFIX if name.endswith(RESULT_SUFFIX) else LEGACY_RESULT_SUFFIX
+                data['result_id'] = name[:-len(suffix)]
+            return self._index_row(data, mtime)
+        except (OSError, EOFError, gzip.BadGzipFile, orjson.JSONDecodeError, AttributeError):
+            return None
+    
+    def reindex(self) -> int:
+        """Rebuild the results index from the result files on disk"""
+        with os.scandir(self.results_dir) as entries:
+            paths = [
+                entry.path for entry in entries
+                if entry.name.endswith((RESULT_SUFFIX, LEGACY_RESULT_SUFFIX))
+            ]
+        
+        rows = []
+        if paths:
+            # Overlap the per-file read latency instead of paying it serially
+            with ThreadPoolExecutor(max_workers=min(REINDEX_READ_WORKERS, len(paths))) as executor:
+                rows = [row for row in executor.map(self._load_index_row, paths) if row]
+        
+        with sqlite3.connect(self.index_path) as conn:
+            conn.execute('DELETE FROM results')
+            conn.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        
+        return len(rows)
     
     async def run_full_analysis(self, repo_path: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """Run complete analysis and aggregate results"""
@@ -41,7 +165,7 @@ class ResultsAggregator:
             analysis_results['trend_analysis'] = trend_results
             
             # Store results
-            result_id = self._store_results(repo_path, analysis_results)
+            result_id = await asyncio.to_thread(self._store_results, repo_path, analysis_results)
             analysis_results['result_id'] = result_id
             
             return analysis_results
@@ -62,7 +186,7 @@ class ResultsAggregator:
             )
             
             if analysis_results.get('success'):
-                result_id = self._store_results(repo_path, analysis_results)
+                result_id = await asyncio.to_thread(self._store_results, repo_path, analysis_results)
                 analysis_results['result_id'] = result_id
             
             return analysis_results
@@ -83,7 +207,7 @@ class ResultsAggregator:
             result_id = f"{repo_name}_{timestamp}"
             
             # Create result file
-            result_file = os.path.join(self.results_dir, f"{result_id}.json")
+            result_file = os.path.join(self.results_dir, f"{result_id}{RESULT_SUFFIX}")
             
             # Prepare results for storage
             storage_results = {
@@ -93,67 +217,100 @@ class ResultsAggregator:
                 **results
             }
             
-            with open(result_file, 'w') as f:
-                json.dump(storage_results, f, indent=2, default=str)
-            
-            return result_id
+            payload = orjson.dumps(storage_results, default=str, option=ORJSON_OPTIONS)
+            with open(result_file, 'wb') as f:
+                f.write(gzip.compress(payload, compresslevel=COMPRESS_LEVEL))
         
         except Exception as e:
             # If storage fails, log error but don't fail the analysis
             print(f"Warning: Failed to store results: {e}")
             return f"unsaved_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        
+        # The result file is already written, so its ID stays valid even if
+        # indexing fails; it is picked up again when the index is rebuilt
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    self._index_row(storage_results, time.time())
+                )
+        except Exception as e:
+            print(f"Warning: Failed to index results {result_id}: {e}")
+        
+        return result_id
+    
+    def has_results(self, result_id: str) -> bool:
+        """Check the index for a stored result"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute('SELECT 1 FROM results WHERE result_id = ?', (result_id,)).fetchone()
+            return row is not None
+        
+        except Exception as e:
+            print(f"Error checking results: {e}")
+            return False
     
     def get_results(self, result_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve stored analysis results"""
         try:
-            result_file = os.path.join(self.results_dir, f"{result_id}.json")
-            
-            if not os.path.exists(result_file):
-                return None
+            for result_file in self._result_files(result_id):
+                if os.path.exists(result_file):
+                    return self._read_result_file(result_file)
             
-            with open(result_file, 'r') as f:
-                return json.load(f)
+            return None
         
         except Exception as e:
             print(f"Error retrieving results: {e}")
             return None
     
+    def _build_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Project a stored result onto the fields used by list_results"""
+        return {
+            'result_id': data.get('result_id'),
+            'repo_path': data.get('repo_path'),
+            'overall_score': data.get('overall_score'),
+            'timestamp': data.get('analysis_metadata', {}).get('timestamp'),
+            'stored_at': data.get('stored_at'),
+            'success': data.get('success', False),
+            'agents_executed': data.get('agents_executed', []),
+            'total_issues': len(data.get('all_issues', []))
+        }
+    
     def list_results(self, repo_path: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """List stored analysis results"""
         try:
-            results = []
+            query = '''
+                SELECT result_id, repo_path, overall_score, timestamp, stored_at,
+                       success, agents_executed, total_issues
+                FROM results
+            '''
+            params: tuple = ()
             
-            for filename in os.listdir(self.results_dir):
-                if not filename.endswith('.json'):
-                    continue
-                
-                try:
-                    filepath = os.path.join(self.results_dir, filename)
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    
-                    # Filter by repo_path if specified
-                    if repo_path and data.get('repo_path') != repo_path:
-                        continue
-                    
-                    # Create summary entry
-                    results.append({
-                        'result_id': data.get('result_id'),
-                        'repo_path': data.get('repo_path'),
-                        'overall_score': data.get('overall_score'),
-                        'timestamp': data.get('analysis_metadata', {}).get('timestamp'),
-                        'stored_at': data.get('stored_at'),
-                        'success': data.get('success', False),
-                        'agents_executed': data.get('agents_executed', []),
-                        'total_issues': len(data.get('all_issues', []))
-                    })
-                
-                except (json.JSONDecodeError, KeyError):
-                    continue
+            # Filter by repo_path if specified
+            if repo_path:
+                query += ' WHERE repo_path = ?'
+                params = (repo_path,)
             
             # Sort by timestamp (newest first) and limit
-            results.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            return results[:limit]
+            query += ' ORDER BY timestamp DESC LIMIT ?'
+            params += (limit,)
+            
+            with self._connect() as conn:
+                rows = conn.execute(query, params).fetchall()
+            
+            return [
+                {
+                    'result_id': row[0],
+                    'repo_path': row[1],
+                    'overall_score': row[2],
+                    'timestamp': row[3],
+                    'stored_at': row[4],
+                    'success': bool(row[5]),
+                    'agents_executed': orjson.loads(row[6]),
+                    'total_issues': row[7]
+                }
+                for row in rows
+            ]
         
         except Exception as e:
             print(f"Error listing results: {e}")
@@ -162,13 +319,16 @@ class ResultsAggregator:
     def delete_results(self, result_id: str) -> bool:
         """Delete stored analysis results"""
         try:
-            result_file = os.path.join(self.results_dir, f"{result_id}.json")
+            with self._connect() as conn:
+                conn.execute('DELETE FROM results WHERE result_id = ?', (result_id,))
             
-            if os.path.exists(result_file):
-                os.remove(result_file)
-                return True
+            deleted = False
+            for result_file in self._result_files(result_id):
+                if os.path.exists(result_file):
+                    os.remove(result_file)
+                    deleted = True
             
-            return False
+            return deleted
         
         except Exception as e:
             print(f"Error deleting results: {e}")
@@ -178,33 +338,47 @@ class ResultsAggregator:
         """Get trend analysis report for a repository"""
         return self.trend_agent.get_trend_report(repo_path, days)
     
-    def cleanup_old_results(self, days_to_keep: int = 90):
+    def _find_expired_results(self, cutoff_time: float) -> List[str]:
+        """List IDs of results stored before cutoff_time"""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT result_id FROM results WHERE mtime < ?', (cutoff_time,)).fetchall()
+        return [row[0] for row in rows]
+    
+    def _unindex_results(self, result_ids: List[str]):
+        """Remove results from the index"""
+        with self._connect() as conn:
+            conn.executemany('DELETE FROM results WHERE result_id = ?', [(rid,) for rid in result_ids])
+    
+    async def _remove_result(self, semaphore: asyncio.Semaphore, result_id: str) -> bool:
+        """Remove a result's files in a worker thread, bounded by the semaphore"""
+        removed = False
+        async with semaphore:
+            for filepath in self._result_files(result_id):
+                try:
+                    await asyncio.to_thread(os.remove, filepath)
+                    removed = True
+                except OSError:
+                    continue
+        return removed
+    
+    async def cleanup_old_results(self, days_to_keep: int = 90):
         """Clean up old result files and trend data"""
         try:
-            from datetime import timedelta
-            cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+            cutoff_time = time.time() - days_to_keep * 86400
             
-            deleted_count = 0
+            expired = await asyncio.to_thread(self._find_expired_results, cutoff_time)
             
-            for filename in os.listdir(self.results_dir):
-                if not filename.endswith('.json'):
-                    continue
-                
-                filepath = os.path.join(self.results_dir, filename)
-                
-                try:
-                    # Check file modification time
-                    file_time = datetime.fromtimestamp(os.path.getmtime(filepath))
-                    
-                    if file_time < cutoff_date:
-                        os.remove(filepath)
-                        deleted_count += 1
-                
-                except OSError:
-                    continue
+            # Overlap unlink latency with a bounded number of in-flight removals
+            semaphore = asyncio.Semaphore(CLEANUP_CONCURRENCY)
+            removed = await asyncio.gather(*[
+                self._remove_result(semaphore, result_id) for result_id in expired
+            ])
+            await asyncio.to_thread(self._unindex_results, expired)
+            
+            deleted_count = sum(1 for ok in removed if ok)
             
             # Also cleanup trend database
-            self.trend_agent.cleanup_old_data(days_to_keep)
+            await asyncio.to_thread(self.trend_agent.cleanup_old_data, days_to_keep)
             
             print(f"Cleaned up {deleted_count} old result files")
             
@@ -1,6 +1,13 @@
 """Embedding layer for code analysis."""
-from .embedder import CodeEmbedder, get_embedder
 from .chunker import CodeChunker
 from .vector_store import VectorStore
 
 __all__ = ["CodeEmbedder", "get_embedder", "CodeChunker", "VectorStore"]
+
+
+def __getattr__(name):
+    # The embedder pulls in torch and sentence-transformers; import it on first use
+    if name in ("CodeEmbedder", "get_embedder"):
+        from . import embedder
+        return getattr(embedder, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,9 @@ from loguru import logger
 
 from config import settings
 
+# Start of a JavaScript/TypeScript function or class
+JS_ENTITY_PATTERN = re.compile(r'(function\s+\w+|const\s+\w+\s*=|class\s+\w+|export\s+(default\s+)?(function|class))')
+
 
 class CodeChunker:
     """Chunks code files into semantic units for embedding."""
@@ -54,7 +57,7 @@ class CodeChunker:
                 # Start new chunk
                 current_chunk = [line]
                 current_start = i
-                current_entity = stripped.split('(')[0].replace('def ', '').replace('class ', '').strip(':')
+                current_entity = stripped.partition('(')[0].replace('def ', '').replace('class ', '').strip(':')
                 indent_level = len(line) - len(stripped)
             
             elif current_chunk:
@@ -93,9 +96,6 @@ class CodeChunker:
         chunks = []
         lines = content.split('\n')
         
-        # Pattern for function/arrow function/class
-        func_pattern = re.compile(r'(function\s+\w+|const\s+\w+\s*=|class\s+\w+|export\s+(default\s+)?(function|class))')
-        
         current_chunk = []
         current_start = 0
         current_entity = None
@@ -105,7 +105,7 @@ class CodeChunker:
             stripped = line.strip()
             
             # Detect function/class start
-            match = func_pattern.search(line)
+            match = JS_ENTITY_PATTERN.search(line)
             if match and not current_chunk:
                 current_entity = match.group(0)
                 current_start = i
@@ -1,14 +1,14 @@
 """LangGraph nodes for code analysis pipeline."""
+import os
 import time
-from pathlib import Path
+from itertools import islice
 from typing import Any, Dict
 from loguru import logger
 
 from graphs.state import AnalysisState
 from services.git_manager import GitManager
-from storage.sqlite_manager import SQLiteManager, compute_file_hash
+from storage.sqlite_manager import SQLiteManager, compute_path_hash
 from embedding.chunker import CodeChunker
-from embedding.embedder import get_embedder
 from embedding.vector_store import VectorStore
 
 
@@ -16,9 +16,41 @@ from embedding.vector_store import VectorStore
 git_manager = GitManager()
 sqlite_manager = SQLiteManager()
 chunker = CodeChunker()
-embedder = get_embedder()
 vector_store = VectorStore()
 
+# Created on first query and reused across runs
+_llm = None
+
+
+def get_llm():
+    """Get or create the Gemini chat client."""
+    global _llm
+    if _llm is None:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from config import settings
+        
+        _llm = ChatGoogleGenerativeAI(
+            model=settings.llm_model,
+            temperature=settings.llm_temperature,
+            max_tokens=settings.llm_max_tokens,
+            google_api_key=settings.gemini_api_key
+        )
+    return _llm
+
+
+def get_embedder():
+    """Get the shared embedder, importing torch and sentence-transformers on first use."""
+    from embedding.embedder import get_embedder as get_code_embedder
+    return get_code_embedder()
+
+
+def _relative_path(file_path: str, root_prefix: str) -> str:
+    """Path relative to the repo root; root_prefix must end with a separator."""
+    # Files from GitManager are always below the root, so slicing is enough
+    if file_path.startswith(root_prefix):
+        return file_path[len(root_prefix):]
+    return os.path.relpath(file_path, root_prefix)
+
 
 async def clone_repository_node(state: AnalysisState) -> AnalysisState:
     """Node 1: Clone Git repository."""
@@ -60,22 +92,23 @@ async def index_repository_node(state: AnalysisState) -> AnalysisState:
         state['repo_id'] = repo_id
         
         # Get code files
-        code_files = git_manager.get_code_files(state['local_path'])
+        code_files = git_manager.get_code_files(
+            state['local_path'], commit_hash=state['commit_hash']
+        )
+        # Relative paths are derived once here and reused by later nodes
+        root_prefix = os.path.join(state['local_path'], '')
+        relative_paths = [_relative_path(file_path, root_prefix) for file_path in code_files]
         state['code_files'] = code_files
+        state['relative_paths'] = relative_paths
         state['total_files'] = len(code_files)
         
         logger.info(f"[INDEX] Found {len(code_files)} code files")
         
         # Index files in database
-        for file_path in code_files:
+        for file_path, relative_path in zip(code_files, relative_paths):
             try:
-                with open(file_path, 'rb') as f:
-                    content_bytes = f.read()
-                
-                file_hash = compute_file_hash(content_bytes)
-                file_size = len(content_bytes)
+                file_hash, file_size = compute_path_hash(file_path)
                 language = git_manager.detect_language(file_path)
-                relative_path = str(Path(file_path).relative_to(state['local_path']))
                 
                 await sqlite_manager.add_file(
                     repo_id=repo_id,
@@ -110,13 +143,12 @@ async def generate_embeddings_node(state: AnalysisState) -> AnalysisState:
         chunk_metadata = []
         
         # Process each file
-        for file_path in state['code_files'][:100]:  # Limit for demo
+        files = zip(state['code_files'], state['relative_paths'])
+        for file_path, relative_path in islice(files, 100):  # Limit for demo
             try:
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read()
                 
-                relative_path = str(Path(file_path).relative_to(state['local_path']))
-                
                 # Chunk the file
                 chunks = chunker.chunk_file(content, file_path)
                 
@@ -139,7 +171,7 @@ async def generate_embeddings_node(state: AnalysisState) -> AnalysisState:
         
         # Generate embeddings in batches
         if all_chunks:
-            embeddings = embedder.embed_batch(all_chunks)
+            embeddings = get_embedder().embed_batch(all_chunks)
             
             # Add to vector store
             embedding_ids = vector_store.add_vectors(embeddings)
@@ -178,7 +210,7 @@ async def search_relevant_code_node(state: AnalysisState) -> AnalysisState:
         vector_store.initialize()
         
         # Generate query embedding
-        query_embedding = embedder.embed_text(query)
+        query_embedding = get_embedder().embed_text(query)
         
         # Search for similar chunks
         ids, scores = vector_store.search(query_embedding, k=10)
@@ -212,16 +244,7 @@ async def query_llm_node(state: AnalysisState) -> AnalysisState:
     state['current_step'] = 'query_llm'
     
     try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        from config import settings
-        
-        # Initialize LLM
-        llm = ChatGoogleGenerativeAI(
-            model=settings.llm_model,
-            temperature=settings.llm_temperature,
-            max_tokens=settings.llm_max_tokens,
-            google_api_key=settings.gemini_api_key
-        )
+        llm = get_llm()
         
         # Build context from relevant chunks
         relevant_chunks = state.get('relevant_chunks', [])
@@ -18,6 +18,7 @@ class AnalysisState(TypedDict):
     
     # Files
     code_files: List[str]
+    relative_paths: List[str]  # parallel to code_files, relative to local_path
     total_files: int
     
     # Chunking & Embedding
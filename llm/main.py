@@ -9,6 +9,11 @@ from pathlib import Path
 from loguru import logger
 import time
 
+try:
+    import uvloop
+except ImportError:  # optional: not available on Windows
+    uvloop = None
+
 # Configure logging
 logger.remove()
 logger.add(
@@ -21,6 +26,20 @@ from config import settings, ensure_directories
 from storage.sqlite_manager import SQLiteManager
 from graphs.analysis_graph import get_analysis_graph
 
+# Divider line used by the menu and the result banners, built once
+DIVIDER = "=" * 80
+
+# Interactive menu, written in one call on every loop iteration
+MENU_TEXT = "\n".join([
+    "",
+    DIVIDER,
+    "📋 Menu:",
+    "  1. Analyze a new repository",
+    "  2. Ask a question about current repository",
+    "  3. Exit",
+    DIVIDER,
+]) + "\n"
+
 
 async def analyze_repository(repo_url: str, query: str = None):
     """
@@ -36,14 +55,11 @@ async def analyze_repository(repo_url: str, query: str = None):
     """
     start_time = time.time()
     
-    print("=" * 80)
-    print("🚀 CodeGuard LangGraph Analysis")
-    print("=" * 80)
-    print(f"📦 Repository: {repo_url}")
+    header = [DIVIDER, "🚀 CodeGuard LangGraph Analysis", DIVIDER, f"📦 Repository: {repo_url}"]
     if query:
-        print(f"💬 Query: {query}")
-    print("=" * 80)
-    print()
+        header.append(f"💬 Query: {query}")
+    header.extend([DIVIDER, ""])
+    sys.stdout.write("\n".join(header) + "\n")
     
     try:
         # Prepare initial state
@@ -55,6 +71,7 @@ async def analyze_repository(repo_url: str, query: str = None):
             "local_path": None,
             "commit_hash": None,
             "code_files": [],
+            "relative_paths": [],
             "total_files": 0,
             "chunks": [],
             "embeddings_generated": False,
@@ -79,30 +96,34 @@ async def analyze_repository(repo_url: str, query: str = None):
         # Calculate execution time
         execution_time = time.time() - start_time
         
-        # Display results
-        print()
-        print("=" * 80)
-        print("✅ Analysis Complete!")
-        print("=" * 80)
-        print(f"📁 Repository: {final_state.get('repo_name', 'unknown')}")
-        print(f"📄 Total Files: {final_state.get('total_files', 0)}")
-        print(f"📝 Chunks: {len(final_state.get('chunks', []))}")
-        print(f"🔍 Relevant Chunks: {len(final_state.get('relevant_chunks', []))}")
-        print(f"⚡ Execution Time: {execution_time:.2f}s")
+        # Display results, written in one go once the pipeline has finished
+        lines = [
+            "",
+            DIVIDER,
+            "✅ Analysis Complete!",
+            DIVIDER,
+            f"📁 Repository: {final_state.get('repo_name', 'unknown')}",
+            f"📄 Total Files: {final_state.get('total_files', 0)}",
+            f"📝 Chunks: {len(final_state.get('chunks', []))}",
+            f"🔍 Relevant Chunks: {len(final_state.get('relevant_chunks', []))}",
+            f"⚡ Execution Time: {execution_time:.2f}s",
+        ]
         
         if final_state.get('errors'):
-            print("\n⚠️  Errors:")
-            for error in final_state['errors']:
-                print(f"   - {error}")
+            lines.append("\n⚠️  Errors:")
+            lines.extend(f"   - {error}" for error in final_state['errors'])
         
         if final_state.get('llm_response'):
-            print("\n" + "=" * 80)
-            print("🤖 AI Analysis:")
-            print("=" * 80)
-            print(final_state['llm_response'])
-            print("=" * 80)
+            lines.extend([
+                "\n" + DIVIDER,
+                "🤖 AI Analysis:",
+                DIVIDER,
+                final_state['llm_response'],
+                DIVIDER,
+            ])
         
-        print("\n✨ Done!\n")
+        lines.append("\n✨ Done!\n")
+        sys.stdout.write("\n".join(lines) + "\n")
         return final_state
         
     except Exception as e:
@@ -139,12 +160,7 @@ async def interactive_mode():
     current_repo = None
     
     while True:
-        print("\n" + "=" * 80)
-        print("📋 Menu:")
-        print("  1. Analyze a new repository")
-        print("  2. Ask a question about current repository")
-        print("  3. Exit")
-        print("=" * 80)
+        sys.stdout.write(MENU_TEXT)
         
         choice = input("\n👉 Enter your choice (1-3): ").strip()
         
@@ -208,4 +224,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
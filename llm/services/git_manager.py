@@ -1,12 +1,37 @@
 """Git repository cloning and management."""
+import os
+import re
 import git
 import shutil
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from loguru import logger
 
 from config import settings
 
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# File extension -> language reported by detect_language
+LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.cs': 'csharp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.swift': 'swift',
+}
+
 
 class GitManager:
     """Handles Git repository operations."""
@@ -14,6 +39,13 @@ class GitManager:
     def __init__(self, repos_path: str = None):
         self.repos_path = Path(repos_path or settings.repos_path)
         self.repos_path.mkdir(parents=True, exist_ok=True)
+        self._exclude_re = compile_exclude_patterns(settings.excluded_patterns)
+        self._excluded_dir_names = frozenset(
+            p.rstrip('/') for p in settings.excluded_patterns if p.endswith('/')
+        )
+        self._code_extensions = frozenset(ext.lower() for ext in settings.code_extensions)
+        # repo path -> (commit hash, code files) of the last scan of that checkout
+        self._scan_cache: dict[str, tuple[str, List[str]]] = {}
     
     def clone_repository(self, repo_url: str, force: bool = False) -> tuple[str, str, str]:
         """
@@ -28,17 +60,24 @@ class GitManager:
         
         # Check if already exists
         if local_path.exists():
-            if force:
-                logger.info(f"Removing existing repository: {local_path}")
-                shutil.rmtree(local_path)
-            else:
+            if not force:
                 logger.info(f"Repository already exists: {local_path}")
                 return self._get_repo_info(local_path, repo_name)
+            
+            # Fetch into the existing checkout rather than downloading it again
+            try:
+                return self._update_repository(local_path, repo_name, repo_url)
+            except Exception as e:
+                logger.warning(f"Could not update {local_path}, cloning again: {e}")
+                logger.info(f"Removing existing repository: {local_path}")
+                shutil.rmtree(local_path)
+                self._scan_cache.pop(str(local_path), None)
         
         # Clone repository
         logger.info(f"Cloning repository: {repo_url}")
         try:
-            repo = git.Repo.clone_from(repo_url, local_path, depth=1)
+            # Shallow and single-branch: only the checked-out commit is transferred
+            repo = git.Repo.clone_from(repo_url, local_path, depth=1, single_branch=True)
             commit_hash = repo.head.commit.hexsha
             logger.info(f"Repository cloned successfully: {repo_name} ({commit_hash[:8]})")
             return str(local_path), repo_name, commit_hash
@@ -46,6 +85,23 @@ class GitManager:
             logger.error(f"Failed to clone repository: {e}")
             raise
     
+    def _update_repository(self, local_path: Path, repo_name: str, repo_url: str) -> tuple[str, str, str]:
+        """Bring an existing clone of repo_url to the remote HEAD with a shallow fetch."""
+        logger.info(f"Updating existing repository: {local_path}")
+        repo = git.Repo(local_path)
+        # Checkouts are keyed by repository name only, so the directory may
+        # hold a different repository with the same name
+        origin_url = repo.remotes.origin.url
+        if origin_url.rstrip('/') != repo_url.rstrip('/'):
+            raise ValueError(f"checkout is a clone of {origin_url}, not {repo_url}")
+        repo.git.fetch('--depth=1', 'origin', 'HEAD')
+        repo.git.reset('--hard', 'FETCH_HEAD')
+        # Leave the tree exactly as a fresh clone would
+        repo.git.clean('-fdx')
+        commit_hash = repo.head.commit.hexsha
+        logger.info(f"Repository updated: {repo_name} ({commit_hash[:8]})")
+        return str(local_path), repo_name, commit_hash
+    
     def _get_repo_info(self, local_path: Path, repo_name: str) -> tuple[str, str, str]:
         """Get info from existing repo."""
         try:
@@ -61,56 +117,125 @@ class GitManager:
         # Handle various Git URL formats
         # https://github.com/user/repo.git -> repo
         # git@github.com:user/repo.git -> repo
-        name = repo_url.rstrip('/').split('/')[-1]
+        name = repo_url.rstrip('/').rpartition('/')[2]
         if name.endswith('.git'):
             name = name[:-4]
         return name
     
-    def get_code_files(self, repo_path: str) -> List[str]:
-        """Get all code files from repository."""
-        repo_path = Path(repo_path)
-        code_files = []
+    def get_code_files(self, repo_path: str, parallel: bool = True,
+                       commit_hash: Optional[str] = None) -> List[str]:
+        """
+        Get all code files from repository.
         
-        excluded_patterns = settings.excluded_patterns
-        code_extensions = settings.code_extensions
+        When commit_hash is given, the file list of a checkout already
+        scanned at that commit is reused instead of walking the tree again.
+        """
+        cache_key = str(repo_path)
+        if commit_hash and commit_hash != "unknown":
+            cached = self._scan_cache.get(cache_key)
+            if cached is not None and cached[0] == commit_hash:
+                logger.info(f"Reusing scan of {Path(repo_path).name} at {commit_hash[:8]}")
+                return list(cached[1])
         
-        for file_path in repo_path.rglob('*'):
-            # Skip if not a file
-            if not file_path.is_file():
-                continue
-            
-            # Skip excluded patterns
-            relative_path = str(file_path.relative_to(repo_path))
-            if any(pattern.rstrip('/') in relative_path for pattern in excluded_patterns):
-                continue
+        if not parallel:
+            code_files = list(self.iter_code_files(repo_path))
+        else:
+            # Scan the root here, then each top-level subtree in a worker
+            # thread; directory reads release the GIL so the IO overlaps
+            subdirs, code_files = [], []
+            self._scan_dir(str(repo_path), '', subdirs, code_files)
             
-            # Check if it's a code file
-            if file_path.suffix.lower() in code_extensions:
-                code_files.append(str(file_path))
+            if subdirs:
+                workers = min(len(subdirs), SCAN_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for subtree_files in executor.map(self._scan_subtree, subdirs):
+                        code_files.extend(subtree_files)
         
-        logger.info(f"Found {len(code_files)} code files in {repo_path.name}")
+        logger.info(f"Found {len(code_files)} code files in {Path(repo_path).name}")
+        if commit_hash and commit_hash != "unknown":
+            self._scan_cache[cache_key] = (commit_hash, list(code_files))
         return code_files
     
-    def detect_language(self, file_path: str) -> str:
-        """Detect programming language from file extension."""
-        ext = Path(file_path).suffix.lower()
+    def iter_code_files(self, repo_path: str) -> Iterator[str]:
+        """Yield code files from repository as they are discovered."""
+        # (absolute dir, POSIX path relative to repo root with trailing '/')
+        pending = [(str(repo_path), '')]
         
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.c': 'c',
-            '.h': 'c',
-            '.cs': 'csharp',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.rb': 'ruby',
-            '.php': 'php',
-            '.swift': 'swift',
-        }
+        while pending:
+            found = []
+            dir_path, relative_dir = pending.pop()
+            self._scan_dir(dir_path, relative_dir, pending, found)
+            yield from found
+    
+    def _scan_subtree(self, root: tuple[str, str]) -> List[str]:
+        """Collect code files below one directory."""
+        pending, found = [root], []
+        while pending:
+            dir_path, relative_dir = pending.pop()
+            self._scan_dir(dir_path, relative_dir, pending, found)
+        return found
+    
+    def _scan_dir(self, dir_path: str, relative_dir: str,
+                  pending: List[tuple[str, str]], found: List[str]) -> None:
+        """Scan one directory: queue subdirectories, collect code files."""
+        exclude_re = self._exclude_re
+        excluded_dir_names = self._excluded_dir_names
+        code_extensions = self._code_extensions
+        
+        try:
+            entries = os.scandir(dir_path)
+        except OSError as e:
+            logger.warning(f"Cannot read directory {dir_path}: {e}")
+            return
         
-        return language_map.get(ext, 'unknown')
+        with entries:
+            for entry in entries:
+                # DirEntry type checks come from d_type, no extra stat
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune excluded directories by name before descending
+                    if entry.name not in excluded_dir_names:
+                        pending.append((entry.path, f"{relative_dir}{entry.name}/"))
+                    continue
+                
+                # Cheapest rejection first: most files aren't code files
+                if file_extension(entry.name) not in code_extensions:
+                    continue
+                
+                # Skip excluded patterns
+                if exclude_re.search(relative_dir + entry.name):
+                    continue
+                
+                if entry.is_file():
+                    found.append(entry.path)
+    
+    def detect_language(self, file_path: str) -> str:
+        """Detect programming language from file extension."""
+        return LANGUAGE_MAP.get(file_extension(os.path.basename(file_path)), 'unknown')
+
+
+def file_extension(name: str) -> str:
+    """Lower-cased extension of a file name, same rules as Path.suffix."""
+    dot = name.rfind('.')
+    if dot <= 0 or dot == len(name) - 1:
+        return ''
+    return name[dot:].lower()
+
+
+def compile_exclude_patterns(patterns: List[str]) -> re.Pattern:
+    """
+    Compile exclusion patterns into one regex over POSIX relative paths.
+    
+    Patterns ending in '/' exclude any directory with that name; all other
+    patterns are globs matched against the end of the path (e.g. '*.min.js').
+    """
+    dir_names = [re.escape(p.rstrip('/')) for p in patterns if p.endswith('/')]
+    globs = [p for p in patterns if not p.endswith('/')]
+    
+    alternatives = []
+    if dir_names:
+        alternatives.append(f"(?:^|/)(?:{'|'.join(dir_names)})/")
+    for glob in globs:
+        alternatives.append(f"(?:^|/){fnmatch.translate(glob)}")
+    
+    # Never-matching regex when nothing is excluded
+    return re.compile('|'.join(alternatives) or r'(?!)')
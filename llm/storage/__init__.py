@@ -1,4 +1,4 @@
 """Storage layer for SQLite and vector operations."""
-from .sqlite_manager import SQLiteManager, compute_file_hash
+from .sqlite_manager import SQLiteManager, compute_file_hash, compute_path_hash
 
-__all__ = ["SQLiteManager", "compute_file_hash"]
+__all__ = ["SQLiteManager", "compute_file_hash", "compute_path_hash"]
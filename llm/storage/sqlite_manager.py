@@ -1,4 +1,5 @@
 """SQLite database manager for metadata and caching."""
+import os
 import aiosqlite
 import json
 import hashlib
@@ -253,15 +254,24 @@ class SQLiteManager:
             cursor = await db.execute(
                 """
                 SELECT 
-                    COUNT(DISTINCT f.file_id) as total_files,
-                    COUNT(fc.chunk_id) as total_chunks,
-                    COUNT(DISTINCT fc.embedding_id) as embedded_chunks,
+                    COUNT(*) as total_files,
+                    SUM(fc.total_chunks) as total_chunks,
+                    SUM(fc.embedded_chunks) as embedded_chunks,
                     SUM(f.file_size) as total_size
                 FROM files f
-                LEFT JOIN file_chunks fc ON f.file_id = fc.file_id
+                LEFT JOIN (
+                    -- Collapse chunks to one row per file so the join doesn't
+                    -- repeat file rows (and their sizes) once per chunk
+                    SELECT file_id,
+                           COUNT(*) as total_chunks,
+                           COUNT(embedding_id) as embedded_chunks
+                    FROM file_chunks
+                    WHERE file_id IN (SELECT file_id FROM files WHERE repo_id = ?)
+                    GROUP BY file_id
+                ) fc ON f.file_id = fc.file_id
                 WHERE f.repo_id = ?
                 """,
-                (repo_id,)
+                (repo_id, repo_id)
             )
             row = await cursor.fetchone()
             return {
@@ -273,5 +283,29 @@ class SQLiteManager:
 
 
 def compute_file_hash(content: bytes) -> str:
-    """Compute SHA256 hash of file content."""
-    return hashlib.sha256(content).hexdigest()
+    """Compute a 128-bit BLAKE2b hash of file content (change detection only)."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def compute_path_hash(file_path: str) -> tuple[str, int]:
+    """
+    Hash a file on disk without loading it into memory.
+    
+    Returns:
+        Tuple of (hash, size in bytes); the hash matches compute_file_hash.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if hasattr(hashlib, 'file_digest'):
+            digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+        else:
+            # Python < 3.11: stream through one reusable buffer
+            digest = hashlib.blake2b(digest_size=16)
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while read := f.readinto(buffer):
+                digest.update(view[:read])
+    return digest.hexdigest(), size